@@ -41,6 +41,7 @@ import time
 import matterlab_spectrometers as spectrometer
 import src.UV_VIS.uv_vis_utils as uv_vis
 import src.NMR.nmr_utils as nmr_utils
+import src.liquid_transfers.liquid_transfers_utils as liquid_transfers
 
 # Import user-editable platform configuration
 import users.config.platform_config as config
@@ -80,6 +81,21 @@ def find_layout_json(config_folder='Auto_Polymerization/users/config/'):
 
 
 def main():
+    """
+    Run the complete Auto_Polymerization workflow (see run_workflow).
+    
+    Clears any earlier shutdown request before the workflow starts and requests shutdown
+    when it stops for any reason (completion, failure, exit or Ctrl+C), so liquid transfers
+    in other threads that are waiting out a COM port retry backoff return instead of retrying.
+    """
+    liquid_transfers.clear_shutdown_request()
+    try:
+        run_workflow()
+    finally:
+        liquid_transfers.request_shutdown()
+
+
+def run_workflow():
     """
     Main platform controller function that executes the complete Auto_Polymerization workflow.
     
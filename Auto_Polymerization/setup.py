@@ -42,7 +42,7 @@ setup(
         "matterlab_serial_device": "source/SerialDevice/src/matterlab_serial_device"
     },
     install_requires=[
-        "numpy>=1.20.0",
+        "numpy>=1.23.0",
         "scipy>=1.7.0",
         "matplotlib>=3.3.0",
         "pandas>=1.3.0",
@@ -64,6 +64,9 @@ setup(
             "sphinx>=4.0.0",
             "sphinx-rtd-theme>=0.5.0",
         ],
+        "jit": [
+            "numba>=0.56.0",
+        ],
     },
     python_requires=">=3.8",
     classifiers=[
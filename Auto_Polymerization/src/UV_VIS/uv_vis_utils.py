@@ -36,6 +36,9 @@ File Naming Conventions:
 Data Format:
 All spectrum files are saved as tab-separated text files with header:
 "Wavelength (nm)\tIntensity (a.u.)" or "Wavelength (nm)\tAbsorbance (a.u.)"
+Each saved spectrum also gets a binary .npy copy with the same stem and the same
+rounded values, which load_spectrum_data reads in preference to the text file
+when it is up to date.
 
 Hardware Requirements:
 - CCS200 spectrometer (USB connection)
@@ -73,13 +76,25 @@ Date: [Current Date]
 Version: 1.0
 """
 
+import atexit
+import io
 import logging
+import os
 import numpy as np
 from pathlib import Path
 from datetime import datetime
 import glob
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional, List, Dict, Tuple, Union
+# Optional JIT compilation of the numeric kernels (pip install numba)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
@@ -98,6 +113,7 @@ DEFAULT_INTEGRATION_TIME = 0.003  # seconds
 DEFAULT_TOLERANCE_PERCENT = 1.0  # percentage
 DEFAULT_NUM_MEASUREMENTS = 10
 MIN_REFERENCE_INTENSITY = 1e-10  # minimum intensity to avoid divide by zero
+MAX_IO_WORKERS = min(8, os.cpu_count() or 1)  # threads for batch loading/saving of spectra
 
 # File headers
 HEADER_INTENSITY = "Wavelength (nm)\tIntensity (a.u.)"
@@ -106,6 +122,12 @@ HEADER_CONVERSION = "Filename\tAbsorbance\tConversion from comparison of absorba
 
 # File format strings
 FMT_SPECTRUM = "%.4f\t%.6f"
+FMT_CONVERSION = "%s\t%.6f\t%.2f"
+
+# Timestamp embedded in every spectrum filename (YYYY-MM-DD_HH-MM-SS)
+TIMESTAMP_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})')
+# Raw spectra written by save_spectrum (reference, t0 and regular spectra)
+RAW_SPECTRUM_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}_UV_VIS_(?:reference_|t0_)?spectrum\.txt$')
 
 
 def get_timestamp() -> str:
@@ -142,10 +164,13 @@ def generate_filename(spectrum_type: str, timestamp: Optional[str] = None, base_
         return f"{timestamp}_UV_VIS_spectrum.txt"
 
 
+@lru_cache(maxsize=8)
 def get_spectra_path(data_folder: str = DATA_FOLDER) -> Path:
     """
     Get the absolute path to the spectra data folder.
     
+    The path only depends on data_folder, so it is resolved once per folder.
+    
     Args:
         data_folder (str): Relative path to the spectra folder.
     
@@ -157,9 +182,55 @@ def get_spectra_path(data_folder: str = DATA_FOLDER) -> Path:
     return Path(__file__).resolve().parents[2] / data_folder
 
 
+# Cache of spectra folder listings, reused until the folder's modification time changes
+_listing_cache = {}
+
+
+def list_spectrum_files(spectra_path: Path) -> List[Path]:
+    """
+    List the .txt files in the spectra folder with a single directory scan.
+    
+    The listing is cached per folder and rebuilt when the folder's modification
+    time changes or when invalidate_listing_cache is called after a save.
+    
+    Args:
+        spectra_path (Path): Path object to the spectra directory.
+    
+    Returns:
+        list: Paths of all .txt files in the folder (empty if the folder does not exist).
+    """
+    cache_key = str(spectra_path)
+    try:
+        mtime = os.stat(spectra_path).st_mtime_ns
+    except OSError:
+        _listing_cache.pop(cache_key, None)
+        return []
+    
+    cached = _listing_cache.get(cache_key)
+    if cached is None or cached['mtime'] != mtime:
+        with os.scandir(spectra_path) as entries:
+            files = [spectra_path / entry.name for entry in entries
+                     if os.path.normcase(entry.name).endswith(".txt")]
+        cached = _listing_cache[cache_key] = {'files': files, 'mtime': mtime}
+    return list(cached['files'])
+
+
+def invalidate_listing_cache(spectra_path: Optional[Path] = None) -> None:
+    """
+    Drop cached folder listings so the next lookup rescans the directory.
+    
+    Args:
+        spectra_path (Path, optional): Folder to invalidate. If None, all listings are dropped.
+    """
+    if spectra_path is None:
+        _listing_cache.clear()
+    else:
+        _listing_cache.pop(str(spectra_path), None)
+
+
 def find_files_by_pattern(spectra_path: Path, pattern: str) -> np.ndarray:
     """
-    Find files containing a specific pattern using numpy operations.
+    Find files containing a specific pattern in the cached folder listing.
     
     Args:
         spectra_path (Path): Path object to the spectra directory.
@@ -168,17 +239,62 @@ def find_files_by_pattern(spectra_path: Path, pattern: str) -> np.ndarray:
     Returns:
         np.ndarray: Array of matching file paths.
     """
-    files = np.array(list(spectra_path.glob("*.txt")))
-    if len(files) == 0:
-        return np.array([])
-    mask = np.char.find(files.astype(str), pattern) >= 0
-    return files[mask]
+    # Plain substring test; np.char.find needed a str copy of the whole listing per call
+    return np.array([f for f in list_spectrum_files(spectra_path) if pattern in str(f)])
+
+
+def get_sidecar_path(file_path: Union[str, Path]) -> Path:
+    """
+    Get the path of the binary .npy sidecar stored next to a spectrum text file.
+    
+    Args:
+        file_path (str or Path): Path to the spectrum text file.
+    
+    Returns:
+        Path: Path to the .npy sidecar.
+    """
+    return Path(file_path).with_suffix(".npy")
+
+
+# Text files already rewritten from UTF-16 to UTF-8 by load_spectrum_data
+_converted_files = set()
+
+
+def detect_utf16_encoding(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Detect whether a text file is UTF-16 from its first bytes.
+    
+    Args:
+        file_path (str or Path): Path to the text file.
+    
+    Returns:
+        str or None: 'utf-16' if the file starts with a UTF-16 BOM, 'utf-16-le' if it
+        looks like UTF-16-LE without a BOM (null high bytes), or None otherwise.
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(4)
+    if head[:2] in (b"\xff\xfe", b"\xfe\xff"):
+        return "utf-16"
+    if len(head) >= 2 and head[0] != 0 and head[1] == 0:
+        return "utf-16-le"
+    return None
+
+
+# Parsed spectra keyed by path, reused while the file's modification time is unchanged
+_spectrum_cache = {}
+_spectrum_cache_max_size = 512  # Maximum number of cached spectra
+# map_files loads spectra from worker threads, so every change to _spectrum_cache holds this lock
+_spectrum_cache_lock = threading.Lock()
 
 
 def load_spectrum_data(file_path: Union[str, Path]) -> Optional[np.ndarray]:
     """
     Load spectrum data from file, handling UTF-8 and UTF-16 encodings.
     If the file is UTF-16, it will be converted to UTF-8 and re-saved.
+    If a .npy sidecar written by save_spectrum_file exists and is not older
+    than the text file, it is loaded instead of parsing the text.
+    
+    Parsed spectra are cached in memory, but the caller gets its own writable copy.
     
     Args:
         file_path (str or Path): Path to the spectrum file.
@@ -186,12 +302,58 @@ def load_spectrum_data(file_path: Union[str, Path]) -> Optional[np.ndarray]:
     Returns:
         np.ndarray or None: Loaded data as a 2D numpy array, or None if loading fails.
     """
+    data = _load_spectrum_cached(file_path)
+    return None if data is None else data.copy()
+
+
+def _load_spectrum_cached(file_path: Union[str, Path]) -> Optional[np.ndarray]:
+    """
+    Load spectrum data like load_spectrum_data, returning the cached array itself.
+    
+    The array is reused until the file's modification time changes, so it is shared
+    and read-only; internal readers that only read the values use this to skip the copy.
+    """
+    cache_key = str(file_path)
     try:
-        return np.loadtxt(file_path, skiprows=1)
-    except Exception as e_utf8:
-        try:
-            # Try UTF-16 with BOM
-            with open(file_path, "r", encoding="utf-16") as fin:
+        mtime = os.stat(file_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    cached = _spectrum_cache.get(cache_key)
+    if cached is not None and mtime is not None and cached['mtime'] == mtime:
+        return cached['data']
+    
+    data = _read_spectrum_file(file_path)
+    if data is None or mtime is None:
+        with _spectrum_cache_lock:
+            _spectrum_cache.pop(cache_key, None)
+        return data
+    
+    data.flags.writeable = False
+    # Take the mtime again: reading may have converted a UTF-16 file in place
+    entry = {'data': data, 'mtime': os.stat(file_path).st_mtime_ns}
+    with _spectrum_cache_lock:
+        if cache_key not in _spectrum_cache and len(_spectrum_cache) >= _spectrum_cache_max_size:
+            # Remove oldest entry (simple FIFO)
+            del _spectrum_cache[next(iter(_spectrum_cache))]
+        _spectrum_cache[cache_key] = entry
+    return data
+
+
+def _read_spectrum_file(file_path: Union[str, Path]) -> Optional[np.ndarray]:
+    """Read a spectrum from its .npy sidecar or text file, bypassing the in-memory cache."""
+    sidecar_path = get_sidecar_path(file_path)
+    try:
+        if sidecar_path.stat().st_mtime >= Path(file_path).stat().st_mtime:
+            return np.load(sidecar_path)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e_npy:
+        logger.warning(f"Could not load sidecar {sidecar_path}, falling back to text: {e_npy}")
+    try:
+        # Sniff the encoding once instead of trying UTF-8 and catching the failure
+        encoding = None if str(file_path) in _converted_files else detect_utf16_encoding(file_path)
+        if encoding is not None:
+            with open(file_path, "r", encoding=encoding) as fin:
                 lines = fin.readlines()
             # Remove BOM if present
             if lines and lines[0].startswith('\ufeff'):
@@ -199,21 +361,12 @@ def load_spectrum_data(file_path: Union[str, Path]) -> Optional[np.ndarray]:
             # Save as UTF-8
             with open(file_path, "w", encoding="utf-8") as fout:
                 fout.writelines(lines)
-            logger.warning(f"File {file_path} was in UTF-16 and has been converted to UTF-8.")
-            return np.loadtxt(file_path, skiprows=1)
-        except Exception as e_utf16:
-            try:
-                # Try UTF-16 without BOM
-                with open(file_path, "r", encoding="utf-16-le") as fin:
-                    lines = fin.readlines()
-                # Save as UTF-8
-                with open(file_path, "w", encoding="utf-8") as fout:
-                    fout.writelines(lines)
-                logger.warning(f"File {file_path} was in UTF-16-LE and has been converted to UTF-8.")
-                return np.loadtxt(file_path, skiprows=1)
-            except Exception as e_utf16le:
-                logger.error(f"Error loading {file_path}: {e_utf16le}")
-                return None
+            _converted_files.add(str(file_path))
+            logger.warning(f"File {file_path} was in {encoding.upper()} and has been converted to UTF-8.")
+        return np.loadtxt(file_path, skiprows=1)
+    except Exception as e:
+        logger.error(f"Error loading {file_path}: {e}")
+        return None
 
 
 def validate_spectrum_data(data: Optional[np.ndarray]) -> bool:
@@ -241,8 +394,21 @@ def save_spectrum_file(file_path: Path, wavelengths: np.ndarray, values: np.ndar
         header (str): Header string for the file
         fmt (str): Format string for np.savetxt
     """
-    np.savetxt(file_path, np.column_stack((wavelengths, values)),
-               header=header, fmt=fmt)
+    data = np.column_stack((wavelengths, values))
+    text = io.StringIO()
+    np.savetxt(text, data, header=header, fmt=fmt)
+    with open(file_path, "w") as f:
+        f.write(text.getvalue())
+    with _spectrum_cache_lock:
+        _spectrum_cache.pop(str(file_path), None)
+    invalidate_listing_cache(Path(file_path).parent)
+    # Binary copy for load_spectrum_data, parsed back from the formatted text so it holds
+    # exactly the rounded values a text-only load would return
+    try:
+        text.seek(0)
+        np.save(get_sidecar_path(file_path), np.loadtxt(text, skiprows=1))
+    except OSError as e:
+        logger.warning(f"Could not write sidecar for {file_path}: {e}")
 
 
 def find_files_by_patterns(spectra_path: Path, include_patterns: Optional[List[str]] = None, 
@@ -258,17 +424,17 @@ def find_files_by_patterns(spectra_path: Path, include_patterns: Optional[List[s
     Returns:
         list: List of matching file paths
     """
-    all_files = list(spectra_path.glob("*.txt"))
-    
-    if include_patterns:
-        for pattern in include_patterns:
-            all_files = [f for f in all_files if pattern in str(f)]
+    include_patterns = include_patterns or []
+    exclude_patterns = exclude_patterns or []
     
-    if exclude_patterns:
-        for pattern in exclude_patterns:
-            all_files = [f for f in all_files if pattern not in str(f)]
-    
-    return all_files
+    # Single pass over the listing, testing every pattern against each path
+    matching_files = []
+    for f in list_spectrum_files(spectra_path):
+        name = str(f)
+        if (all(pattern in name for pattern in include_patterns)
+                and not any(pattern in name for pattern in exclude_patterns)):
+            matching_files.append(f)
+    return matching_files
 
 
 def zero_negatives(array: np.ndarray) -> np.ndarray:
@@ -281,20 +447,40 @@ def zero_negatives(array: np.ndarray) -> np.ndarray:
     Returns:
         np.ndarray: Array with all negative values replaced by zero.
     """
-    return np.where(array < 0, 0, array)
+    return np.maximum(array, 0)
+
+
+def zero_negatives_inplace(array: np.ndarray) -> np.ndarray:
+    """
+    Set all negative values of a float array to zero in place.
+    
+    Use instead of zero_negatives when the caller owns the array and does not
+    need the original values.
+    
+    Args:
+        array (np.ndarray): Input array (modified in place).
+    
+    Returns:
+        np.ndarray: The same array, with all negative values replaced by zero.
+    """
+    return np.maximum(array, 0, out=array)
 
 
+@lru_cache(maxsize=4096)
 def extract_timestamp(filename_stem: str) -> str:
     """
     Extract timestamp from a filename stem.
     
+    Results are memoized, since the same filenames are sorted again on every
+    pipeline run.
+    
     Args:
         filename_stem (str): The stem of the filename (without extension).
     
     Returns:
         str: Extracted timestamp or 'unknown' if not found.
     """
-    match = re.search(r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})', filename_stem)
+    match = TIMESTAMP_PATTERN.search(filename_stem)
     return match.group(1) if match else "unknown"
 
 
@@ -302,29 +488,159 @@ def find_wavelength_index(wavelengths: np.ndarray, target_wavelength: float = TA
     """
     Find the index of the wavelength closest to the target wavelength.
     
+    Uses a binary search, so the wavelengths must be sorted in ascending order
+    (as returned by the CCS200). If the target lies exactly between two
+    wavelengths, the lower index is returned.
+    
     Args:
-        wavelengths (np.ndarray): Array of wavelength values
+        wavelengths (np.ndarray): Array of wavelength values (ascending)
         target_wavelength (float): Target wavelength to find
     
     Returns:
         int: Index of the closest wavelength
     """
-    return int(np.argmin(np.abs(wavelengths - target_wavelength)))
+    idx = int(np.searchsorted(wavelengths, target_wavelength))
+    if idx == len(wavelengths):
+        return idx - 1
+    if idx > 0 and target_wavelength - wavelengths[idx - 1] <= wavelengths[idx] - target_wavelength:
+        return idx - 1
+    return idx
+
+
+def wavelengths_match(wavelengths: np.ndarray, reference_wavelengths: np.ndarray) -> bool:
+    """
+    Check whether a spectrum is on the same wavelength grid as the reference.
+    
+    Spectra from the same spectrometer share a bit-identical grid, so an exact
+    comparison is tried first and np.allclose is only evaluated if that fails.
+    
+    Args:
+        wavelengths (np.ndarray): Wavelength values of the spectrum
+        reference_wavelengths (np.ndarray): Wavelength values of the reference
+    
+    Returns:
+        bool: True if the grids have the same shape and (nearly) equal values
+    """
+    if wavelengths.shape != reference_wavelengths.shape:
+        return False
+    return bool(np.array_equal(wavelengths, reference_wavelengths)
+                or np.allclose(wavelengths, reference_wavelengths))
+
+
+# Cache of t0 grid lookups so repeated stability/conversion checks skip reloading t0
+_t0_reference_cache = {}
+_t0_cache_max_size = 8  # Maximum number of cached t0 files
+
+
+def get_t0_reference(t0_file: Union[str, Path], target_wavelength: float = TARGET_WAVELENGTH
+                     ) -> Optional[Tuple[np.ndarray, int, float]]:
+    """
+    Get the wavelength grid, target index and target absorbance of a t0 spectrum.
+    
+    Results are cached per file and target wavelength and reused until the
+    file's modification time changes.
+    
+    Args:
+        t0_file (str or Path): Path to the t0 absorbance file.
+        target_wavelength (float): Wavelength to look up.
+    
+    Returns:
+        tuple or None: (wavelengths, wavelength_idx, t0_absorbance_target), or None if loading fails.
+    """
+    cache_key = (str(t0_file), target_wavelength)
+    try:
+        mtime = Path(t0_file).stat().st_mtime
+    except OSError:
+        mtime = None
+    
+    cached = _t0_reference_cache.get(cache_key)
+    if cached is not None and mtime is not None and cached['mtime'] == mtime:
+        return cached['reference']
+    
+    t0_data = _load_spectrum_cached(t0_file)
+    if not validate_spectrum_data(t0_data):
+        _t0_reference_cache.pop(cache_key, None)
+        return None
+    
+    t0_wavelengths = t0_data[:, 0]
+    wavelength_idx = find_wavelength_index(t0_wavelengths, target_wavelength)
+    reference = (t0_wavelengths, wavelength_idx, t0_data[wavelength_idx, 1])
+    
+    if mtime is not None:
+        if cache_key not in _t0_reference_cache and len(_t0_reference_cache) >= _t0_cache_max_size:
+            # Remove oldest entry (simple FIFO)
+            del _t0_reference_cache[next(iter(_t0_reference_cache))]
+        _t0_reference_cache[cache_key] = {'reference': reference, 'mtime': mtime}
+    return reference
+
+
+# Spectrometer handle shared by all take_spectrum calls, opened on first use
+_spectrometer = None
+# Wavelength grid of the open spectrometer; fixed per device, so read once per connection
+_spectrometer_wavelengths = None
 
 
 def get_spectrometer():
     """
-    Get an instance of the CCS200 spectrometer.
+    Get the shared instance of the CCS200 spectrometer, opening it on first use.
+    
+    The connection is kept open between measurements and closed by
+    shutdown_spectrometer (called automatically at interpreter exit).
     
     Returns:
         CCSSpectrometer: Instance of the spectrometer.
     """
-    from matterlab_spectrometers.ccs_spectrometer import CCSSpectrometer
-    return CCSSpectrometer(
-        usb_port="USB",
-        device_model="CCS200",
-        device_id="M00479664"
-    )
+    global _spectrometer
+    if _spectrometer is None:
+        from matterlab_spectrometers.ccs_spectrometer import CCSSpectrometer
+        _spectrometer = CCSSpectrometer(
+            usb_port="USB",
+            device_model="CCS200",
+            device_id="M00479664"
+        )
+    return _spectrometer
+
+
+def shutdown_spectrometer() -> None:
+    """
+    Close the shared spectrometer connection, if open.
+    
+    The next get_spectrometer call opens a new connection.
+    """
+    global _spectrometer, _spectrometer_wavelengths
+    _spectrometer_wavelengths = None
+    if _spectrometer is None:
+        return
+    try:
+        _spectrometer.close_instrument()
+    except Exception as e:
+        logger.warning(f"Error closing spectrometer: {e}")
+    finally:
+        _spectrometer = None
+
+
+atexit.register(shutdown_spectrometer)
+
+
+def get_spectrometer_wavelengths():
+    """
+    Get the wavelength grid of the shared spectrometer, querying the device only once.
+    
+    The grid is fixed per device, so it is kept until shutdown_spectrometer closes the connection.
+    The returned array is shared and read-only; copy it before modifying it.
+    
+    Returns:
+        np.ndarray or None: Wavelength values, or None if the device returned no data.
+    """
+    global _spectrometer_wavelengths
+    if _spectrometer_wavelengths is None:
+        wavelengths = get_spectrometer().get_wavelength_data()
+        if wavelengths is None:
+            return None
+        wavelengths = np.array(wavelengths)
+        wavelengths.flags.writeable = False
+        _spectrometer_wavelengths = wavelengths
+    return _spectrometer_wavelengths
 
 
 def save_spectrum(wavelengths: np.ndarray, spectrum: np.ndarray, timestamp: str, 
@@ -362,6 +678,47 @@ def save_spectrum(wavelengths: np.ndarray, spectrum: np.ndarray, timestamp: str,
     return file_path
 
 
+# Absorbance at the target index per file, so each spectrum is read once for stability checks
+_target_absorbance_cache = {}
+_target_absorbance_cache_max_size = 256  # Maximum number of cached values
+
+
+def get_target_absorbance(file_path: Path, wavelength_idx: int) -> Optional[float]:
+    """
+    Get the absorbance of a spectrum file at one wavelength index, cached per file.
+    
+    The cached value is reused until the file's modification time changes.
+    
+    Args:
+        file_path (Path): Path to the absorbance file.
+        wavelength_idx (int): Index into the wavelength grid.
+    
+    Returns:
+        float or None: Absorbance at the index, or None if the file cannot be loaded.
+    """
+    cache_key = (str(file_path), wavelength_idx)
+    try:
+        mtime = os.stat(file_path).st_mtime_ns
+    except OSError:
+        _target_absorbance_cache.pop(cache_key, None)
+        return None
+    
+    cached = _target_absorbance_cache.get(cache_key)
+    if cached is not None and cached['mtime'] == mtime:
+        return cached['value']
+    
+    data = _load_spectrum_cached(file_path)
+    if not validate_spectrum_data(data) or len(data) <= wavelength_idx:
+        return None
+    value = float(data[wavelength_idx, 1])
+    
+    if cache_key not in _target_absorbance_cache and len(_target_absorbance_cache) >= _target_absorbance_cache_max_size:
+        # Remove oldest entry (simple FIFO)
+        del _target_absorbance_cache[next(iter(_target_absorbance_cache))]
+    _target_absorbance_cache[cache_key] = {'value': value, 'mtime': mtime}
+    return value
+
+
 def check_absorbance_stability(data_folder: str = DATA_FOLDER, target_wavelength: float = TARGET_WAVELENGTH, 
                               num_measurements: int = DEFAULT_NUM_MEASUREMENTS, 
                               tolerance_percent: float = DEFAULT_TOLERANCE_PERCENT) -> bool:
@@ -389,15 +746,11 @@ def check_absorbance_stability(data_folder: str = DATA_FOLDER, target_wavelength
         logger.warning("No t0 absorbance file found for stability check!")
         return False
     
-    t0_data = load_spectrum_data(t0_files[0])
-    if t0_data is None:
+    t0_reference = get_t0_reference(t0_files[0], target_wavelength)
+    if t0_reference is None:
         logger.warning("Could not load t0 absorbance data for stability calculation")
         return False
-    
-    t0_wavelengths = t0_data[:, 0]
-    t0_absorbances = t0_data[:, 1]
-    wavelength_idx = find_wavelength_index(t0_wavelengths, target_wavelength)
-    t0_absorbance_target = t0_absorbances[wavelength_idx]
+    _, wavelength_idx, t0_absorbance_target = t0_reference
     
     # Calculate absolute tolerance as percentage of t0 absorbance
     absolute_tolerance = (tolerance_percent / 100.0) * t0_absorbance_target
@@ -409,25 +762,20 @@ def check_absorbance_stability(data_folder: str = DATA_FOLDER, target_wavelength
         return False  # Not enough measurements yet
     
     # Sort by timestamp and get the last N measurements
-    sample_files.sort(key=lambda x: extract_timestamp(Path(x).stem))
+    sample_files.sort(key=lambda f: extract_timestamp(f.stem))
     recent_files = sample_files[-num_measurements:]
     
-    absorbance_values = []
-    for file in recent_files:
-        data = load_spectrum_data(file)
-        if data is not None and validate_spectrum_data(data):
-            wavelengths = data[:, 0]
-            absorbances = data[:, 1]
-            wavelength_idx = find_wavelength_index(wavelengths, target_wavelength)
-            absorbance_values.append(absorbances[wavelength_idx])
-    
-    if len(absorbance_values) < num_measurements:
-        return False  # Could not load all required measurements
-    
-    # Check if the difference between consecutive measurements is within tolerance
-    for i in range(1, len(absorbance_values)):
-        if abs(absorbance_values[i] - absorbance_values[i-1]) > absolute_tolerance:
+    # Walk back from the newest measurement so a recent change stops the check before
+    # older files are read; values seen on earlier calls come from the cache
+    previous_value = None
+    for file in reversed(recent_files):
+        value = get_target_absorbance(file, wavelength_idx)
+        if value is None:
+            return False  # Could not load all required measurements
+        # Check if the difference between consecutive measurements is within tolerance
+        if previous_value is not None and abs(previous_value - value) > absolute_tolerance:
             return False  # Significant change detected
+        previous_value = value
     
     return True  # All measurements are within tolerance
 
@@ -458,13 +806,15 @@ def take_spectrum(reference: bool = False, t0: bool = False, calculate_conversio
     spec = get_spectrometer()
     try:
         spectrum = spec.measure_spectrum(integration_time)
-        wavelengths = spec.get_wavelength_data()
+        wavelengths = get_spectrometer_wavelengths()
         timestamp = get_timestamp()
         
         # Check if we got valid data from spectrometer
         if spectrum is None or wavelengths is None:
             logger.error("Failed to get valid spectrum data from spectrometer")
             return None, None, None, None, False
+        # Callers get their own copy, so changing it cannot corrupt the cached grid
+        wavelengths = wavelengths.copy()
         
         if reference:
             filename = generate_filename(PATTERN_REFERENCE, timestamp)
@@ -478,20 +828,24 @@ def take_spectrum(reference: bool = False, t0: bool = False, calculate_conversio
             return spectrum, wavelengths, filename, None, False
         else:
             filename = generate_filename("spectrum", timestamp)
-            save_spectrum(wavelengths, spectrum, timestamp, filename)
+            file_path = save_spectrum(wavelengths, spectrum, timestamp, filename)
             logger.info(f"Spectrum saved as {filename}")
             
             # Check if absorbance has stabilized (only for regular spectra, not reference/t0)
             reaction_complete = check_absorbance_stability()
             
             if calculate_conversion:
+                # Only the new spectrum needs processing once reference and t0 are done
+                conversion: Optional[float] = process_new_spectrum(file_path)
+                if conversion is not None:
+                    return spectrum, wavelengths, filename, conversion, reaction_complete
+                
                 # Run the full pipeline
                 remove_negatives_from_spectra()
                 calculate_absorbance()
                 conversion_results = calculate_conversion_at_520nm()
                 
                 # Find the conversion for this specific spectrum
-                conversion: Optional[float] = None
                 if conversion_results and 'filenames' in conversion_results:
                     # Look for the most recent conversion (should be the one we just added)
                     filenames = conversion_results['filenames']
@@ -510,9 +864,112 @@ def take_spectrum(reference: bool = False, t0: bool = False, calculate_conversio
                 
     except Exception as e:
         logger.error(f"Error taking spectrum: {e}")
+        # Drop the connection so the next call reopens it
+        shutdown_spectrometer()
         return None, None, None, None, False
-    finally:
-        spec.close_instrument()
+
+
+def _absorbance_kernel(sample_intensities: np.ndarray, log_reference: np.ndarray,
+                       min_intensity: float) -> np.ndarray:
+    """
+    Absorbance of each sample row against the reference: log10(reference) - log10(sample).
+    
+    Zero and negative sample intensities are floored to min_intensity to avoid divide by zero.
+    Replaced by a numba-compiled loop of the same arithmetic when numba is installed.
+    
+    Args:
+        sample_intensities (np.ndarray): (N_files, N_wavelengths) sample intensities
+        log_reference (np.ndarray): (N_wavelengths,) log10 of the floored reference intensities
+        min_intensity (float): Floor for zero/negative intensities
+    
+    Returns:
+        np.ndarray: (N_files, N_wavelengths) absorbance values
+    """
+    # np.where gives a fresh array, so the log and the subtraction can reuse it in place
+    absorbance = np.where(sample_intensities <= 0, min_intensity, sample_intensities)
+    np.log10(absorbance, out=absorbance)
+    return np.subtract(log_reference, absorbance, out=absorbance)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _absorbance_kernel(sample_intensities, log_reference, min_intensity):  # noqa: F811
+        """Numba version of _absorbance_kernel; one fused pass without temporaries."""
+        out = np.empty_like(sample_intensities)
+        for i in range(sample_intensities.shape[0]):
+            for j in range(sample_intensities.shape[1]):
+                sample = sample_intensities[i, j]
+                out[i, j] = log_reference[j] - np.log10(sample if sample > 0 else min_intensity)
+        return out
+
+
+@lru_cache(maxsize=4)
+def _load_reference_log(path_str: str, mtime_ns: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Load a reference spectrum and take log10 of its floored intensities (cached per file version)."""
+    reference_data = _load_spectrum_cached(path_str)
+    if not validate_spectrum_data(reference_data):
+        return None
+    reference_intensities = reference_data[:, 1]
+    reference_intensities = np.where(reference_intensities <= 0, MIN_REFERENCE_INTENSITY, reference_intensities)
+    return reference_data[:, 0], np.log10(reference_intensities)
+
+
+def get_reference_log(reference_file: Path) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Get the wavelengths and log10 intensities of a reference spectrum.
+    
+    The log is computed once per reference file and reused until the file's
+    modification time changes. The returned arrays are shared and must not be modified.
+    
+    Args:
+        reference_file (Path): Path to the (negative-removed) reference spectrum.
+    
+    Returns:
+        tuple or None: (wavelengths, log_reference), or None if the reference cannot be loaded.
+    """
+    try:
+        mtime = os.stat(reference_file).st_mtime_ns
+    except OSError:
+        return None
+    return _load_reference_log(str(reference_file), mtime)
+
+
+def map_files(func, items: List) -> List:
+    """
+    Apply a per-file function (load or save) to each item, overlapping the file I/O in threads.
+    
+    Falls back to a plain loop for a single item, so the common one-new-spectrum
+    case pays no thread start-up cost.
+    
+    Args:
+        func (callable): Function to apply to each item
+        items (list): Items to process (e.g. file paths)
+    
+    Returns:
+        list: Results of func, in the same order as items
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def is_output_up_to_date(output_path: Path, *input_paths: Path) -> bool:
+    """
+    Check whether a derived file exists and is at least as new as all of its inputs.
+    
+    Args:
+        output_path (Path): Derived file (e.g. a '_neg_removed' or '_absorbance' spectrum)
+        *input_paths (Path): Files the output was calculated from
+    
+    Returns:
+        bool: True if the output exists and no input was modified after it
+    """
+    try:
+        output_mtime = os.stat(output_path).st_mtime_ns
+        return all(os.stat(path).st_mtime_ns <= output_mtime for path in input_paths)
+    except OSError:
+        return False
 
 
 def remove_negatives_from_spectra(data_folder: str = DATA_FOLDER) -> List[Path]:
@@ -532,6 +989,7 @@ def remove_negatives_from_spectra(data_folder: str = DATA_FOLDER) -> List[Path]:
     Notes:
         - The output files are saved in the same directory as the originals, with '_neg_removed' appended to the stem.
         - This function should be run before any absorbance or conversion analysis.
+        - Spectra whose '_neg_removed' file is already newer than the original are not reprocessed.
         - Uses find_files_by_patterns for robust file selection.
     """
     spectra_path = get_spectra_path(data_folder)
@@ -541,19 +999,38 @@ def remove_negatives_from_spectra(data_folder: str = DATA_FOLDER) -> List[Path]:
         exclude_patterns=[PATTERN_NEG_REMOVED]
     )
     
+    output_files = [file.with_name(file.stem + "_neg_removed.txt") for file in files_to_process]
+    stale_files = [file for file, output in zip(files_to_process, output_files)
+                   if not is_output_up_to_date(output, file)]
+    loaded = dict(zip(stale_files, map_files(_load_spectrum_cached, stale_files)))
+    
     results = []
-    for file in files_to_process:
-        data = load_spectrum_data(file)
-        if not validate_spectrum_data(data):
-            continue
-        # Data is guaranteed to be valid at this point
-        assert data is not None  # Help type checker
-        wavelengths = data[:, 0]
-        intensities = zero_negatives(data[:, 1])
-        new_filename = file.with_name(file.stem + "_neg_removed.txt")
-        save_spectrum_file(new_filename, wavelengths, intensities, HEADER_INTENSITY)
-        logger.info(f"Saved negative-removed spectrum to {new_filename}")
-        results.append(new_filename)
+    jobs = []  # (output file, data) still to be written
+    for file, output in zip(files_to_process, output_files):
+        if file in loaded:
+            data = loaded[file]
+            if not validate_spectrum_data(data):
+                continue
+            # Data is guaranteed to be valid at this point
+            assert data is not None  # Help type checker
+            jobs.append((output, data))
+        results.append(output)
+    if not jobs:
+        return results
+    
+    # Zero the negatives of all spectra in one pass; files may differ in length,
+    # so concatenate and split back at the file boundaries
+    split_points = np.cumsum([len(data) for _, data in jobs])[:-1]
+    all_intensities = zero_negatives_inplace(np.concatenate([data[:, 1] for _, data in jobs]))
+    
+    def save(job):
+        output, data, intensities = job
+        save_spectrum_file(output, data[:, 0], intensities, HEADER_INTENSITY)
+    
+    map_files(save, [(output, data, intensities) for (output, data), intensities
+                     in zip(jobs, np.split(all_intensities, split_points))])
+    for output, _ in jobs:
+        logger.info(f"Saved negative-removed spectrum to {output}")
     return results
 
 
@@ -563,15 +1040,20 @@ def calculate_absorbance(data_folder: str = DATA_FOLDER, reference_pattern: str
 
     For each sample spectrum (with '_neg_removed' in the filename and not containing 'reference', 't0', or 'absorbance'),
     calculate absorbance using the reference spectrum (matching reference_pattern and '_neg_removed').
-    Both sample and reference intensities are preprocessed to set negative values to zero.
+    The inputs are '_neg_removed' spectra, so intensities are not clipped again here; zero
+    intensities are floored to MIN_REFERENCE_INTENSITY to avoid divide by zero.
     Absorbance is calculated as -log10(sample_intensity / reference_intensity) at each wavelength.
+    Samples whose '_absorbance' file is newer than both the sample and the reference are not
+    saved again; their absorbance is still calculated from the cached reference, so the
+    returned arrays do not depend on which files had to be written.
 
     Args:
         data_folder (str): Path to folder containing spectra files.
         reference_pattern (str): Pattern to identify the reference spectrum (default: 'reference').
 
     Returns:
-        list: List of absorbance data arrays, one per processed file. List may be empty if no files match.
+        list: List of absorbance data arrays (wavelength, absorbance) at full precision, one per
+            aligned sample spectrum, each a new writable array. List may be empty if no files match.
     """
     spectra_path = get_spectra_path(data_folder)
     # Find reference spectrum (negative-removed)
@@ -579,43 +1061,166 @@ def calculate_absorbance(data_folder: str = DATA_FOLDER, reference_pattern: str
     if len(ref_files) == 0:
         logger.warning(f"No reference spectrum found with pattern '{reference_pattern}' and '_neg_removed'.")
         return []
-    reference_data = load_spectrum_data(ref_files[0])
-    if not validate_spectrum_data(reference_data):
+    reference = get_reference_log(ref_files[0])
+    if reference is None:
         logger.warning("Reference spectrum is invalid.")
         return []
-    # Reference data is guaranteed to be valid at this point
-    assert reference_data is not None  # Help type checker
-    ref_wavelengths = reference_data[:, 0]
-    ref_intensities = zero_negatives(reference_data[:, 1])
+    ref_wavelengths, log_reference = reference
     # Find all sample spectra (negative-removed, not reference, not absorbance, not t0)
     sample_files = find_files_by_patterns(
         spectra_path,
         include_patterns=["_neg_removed"],
         exclude_patterns=[reference_pattern, "absorbance"]
     )
-    results = []
-    for file in sample_files:
-        data = load_spectrum_data(file)
+    output_files = [file.with_name(file.stem + "_absorbance.txt") for file in sample_files]
+    up_to_date = [is_output_up_to_date(output, file, ref_files[0])
+                  for file, output in zip(sample_files, output_files)]
+    loaded = map_files(_load_spectrum_cached, sample_files)
+    
+    pending = []  # (output file, sample data, whether the output file has to be written)
+    for file, output_filename, done, data in zip(sample_files, output_files, up_to_date, loaded):
         if not validate_spectrum_data(data):
             continue
         # Data is guaranteed to be valid at this point
         assert data is not None  # Help type checker
-        wavelengths = data[:, 0]
-        intensities = zero_negatives(data[:, 1])
         # Ensure wavelength alignment
-        if not np.allclose(wavelengths, ref_wavelengths):
+        if not wavelengths_match(data[:, 0], ref_wavelengths):
             logger.warning(f"Wavelength mismatch in {file}, skipping.")
             continue
-        # Avoid divide by zero - protect both reference and sample intensities
-        reference_intensities = np.where(ref_intensities == 0, MIN_REFERENCE_INTENSITY, ref_intensities)
-        sample_intensities = np.where(intensities == 0, MIN_REFERENCE_INTENSITY, intensities)
-        absorbance = -np.log10(sample_intensities / reference_intensities)
-        base_name = Path(file).stem
-        output_filename = file.with_name(base_name + "_absorbance.txt")
-        save_spectrum_file(output_filename, wavelengths, absorbance, HEADER_ABSORBANCE)
+        pending.append((output_filename, data, not done))
+    if not pending:
+        return []
+    
+    # All aligned samples as one (N_files, N_wavelengths) matrix; the reference log is
+    # cached per reference file: -log10(sample / reference) == log10(reference) - log10(sample)
+    sample_intensities = np.vstack([data[:, 1] for _, data, _ in pending])
+    absorbances = _absorbance_kernel(sample_intensities, log_reference, MIN_REFERENCE_INTENSITY)
+    
+    def save(job):
+        (output_filename, data, _), absorbance = job
+        save_spectrum_file(output_filename, data[:, 0], absorbance, HEADER_ABSORBANCE)
+    
+    stale = [(job, absorbance) for job, absorbance in zip(pending, absorbances) if job[2]]
+    map_files(save, stale)
+    for (output_filename, _, _), _ in stale:
         logger.info(f"Absorbance spectrum saved to {output_filename}")
-        results.append(np.column_stack((wavelengths, absorbance)))
-    return results
+    return [np.column_stack((data[:, 0], absorbance)) for (_, data, _), absorbance in zip(pending, absorbances)]
+
+
+# Parsed conversion_values.txt per file, reused while the file is unchanged on disk
+_conversion_log_cache = {}
+
+
+def read_conversion_log(file_path: Path) -> Dict:
+    """
+    Read conversion_values.txt into memory, reusing the cached copy if the file is unchanged.
+    
+    Args:
+        file_path (Path): Path to conversion_values.txt.
+    
+    Returns:
+        dict: Dictionary containing:
+            - header: Header line of the file
+            - rows: Parsed (filename, absorbance, conversion, timestamp) tuples in file order
+            - processed: Set of filenames already listed in the file
+            - appendable: True if new rows may be appended (file read cleanly, sorted, newline-terminated)
+            - stat: (st_mtime_ns, st_size) of the file when it was read, or None
+    """
+    cache_key = str(file_path)
+    try:
+        stat = file_path.stat()
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        _conversion_log_cache.pop(cache_key, None)
+        return {'header': HEADER_CONVERSION, 'rows': [], 'processed': set(), 'appendable': False, 'stat': None}
+    
+    cached = _conversion_log_cache.get(cache_key)
+    if cached is not None and cached['stat'] == file_stat:
+        return cached
+    
+    header = HEADER_CONVERSION
+    rows = []
+    processed = set()
+    appendable = False
+    try:
+        with open(file_path, "r") as f:
+            lines = f.readlines()
+        for line in lines[1:]:  # Skip header
+            if line.strip():
+                processed.add(line.split('\t')[0])
+        if lines:  # Keep header from existing file
+            header = lines[0]
+        for line in lines[1:]:
+            if line.strip():
+                parts = line.strip().split('\t')
+                if len(parts) >= 3:
+                    rows.append((parts[0], float(parts[1]), float(parts[2]), extract_timestamp(parts[0])))
+        timestamps = [row[3] for row in rows]
+        appendable = bool(lines) and lines[-1].endswith('\n') and timestamps == sorted(timestamps)
+    except Exception as e:
+        logger.warning(f"Could not read existing conversion file: {e}")
+        header = HEADER_CONVERSION
+    
+    conversion_log = {
+        'header': header,
+        'rows': rows,
+        'processed': processed,
+        'appendable': appendable,
+        'stat': file_stat
+    }
+    _conversion_log_cache[cache_key] = conversion_log
+    return conversion_log
+
+
+def format_conversion_rows(rows: List[Tuple[str, float, float, str]]) -> str:
+    """
+    Format conversion rows as the tab-separated lines of conversion_values.txt.
+    
+    Args:
+        rows (list): (filename, absorbance, conversion, timestamp) tuples.
+    
+    Returns:
+        str: One FMT_CONVERSION line per row, each terminated by a newline.
+    """
+    return "".join(FMT_CONVERSION % row[:3] + "\n" for row in rows)
+
+
+def write_conversion_log(file_path: Path, conversion_log: Dict, new_rows: List[Tuple[str, float, float, str]]) -> None:
+    """
+    Add new rows to conversion_values.txt, keeping the file sorted by timestamp.
+    
+    If the existing file is appendable and all new rows are at least as recent as
+    its last row, the new rows are appended. Otherwise the whole file is merged, sorted
+    and rewritten.
+    
+    Args:
+        file_path (Path): Path to conversion_values.txt.
+        conversion_log (dict): Current contents as returned by read_conversion_log.
+        new_rows (list): New (filename, absorbance, conversion, timestamp) tuples sorted by timestamp.
+    """
+    rows = conversion_log['rows']
+    can_append = conversion_log['appendable'] and (not rows or new_rows[0][3] >= rows[-1][3])
+    
+    # Format the rows into a single buffer so each update is one write() call
+    if can_append:
+        all_rows = rows + new_rows
+        with open(file_path, "a") as f:
+            f.write(format_conversion_rows(new_rows))
+    else:
+        all_rows = sorted(rows + new_rows, key=itemgetter(3))
+        with open(file_path, "w") as f:
+            f.write(conversion_log['header'] + format_conversion_rows(all_rows))
+    invalidate_listing_cache(file_path.parent)
+    
+    # Keep the in-memory copy in step with the file so the next call does not re-read it
+    stat = file_path.stat()
+    _conversion_log_cache[str(file_path)] = {
+        'header': conversion_log['header'],
+        'rows': all_rows,
+        'processed': conversion_log['processed'] | {row[0] for row in new_rows},
+        'appendable': True,
+        'stat': (stat.st_mtime_ns, stat.st_size)
+    }
 
 
 def calculate_conversion_at_520nm(data_folder: str = DATA_FOLDER) -> Dict[str, Union[List[str], List[float], float]]:
@@ -647,14 +1252,10 @@ def calculate_conversion_at_520nm(data_folder: str = DATA_FOLDER) -> Dict[str, U
         return {}
     
     t0_file = t0_absorbance_files[0]
-    t0_data = load_spectrum_data(t0_file)
-    if t0_data is None or not validate_spectrum_data(t0_data):
+    t0_reference = get_t0_reference(t0_file, TARGET_WAVELENGTH)
+    if t0_reference is None:
         return {}
-    
-    t0_wavelengths = t0_data[:, 0]
-    t0_absorbances = t0_data[:, 1]
-    wavelength_idx = find_wavelength_index(t0_wavelengths, TARGET_WAVELENGTH)
-    t0_absorbance_target = t0_absorbances[wavelength_idx]
+    t0_wavelengths, wavelength_idx, t0_absorbance_target = t0_reference
     actual_wavelength = t0_wavelengths[wavelength_idx]
     logger.info(f"Using absorbance at {actual_wavelength:.1f} nm (closest to {TARGET_WAVELENGTH} nm)")
     logger.info(f"t0 absorbance: {t0_absorbance_target:.6f}")
@@ -663,108 +1264,173 @@ def calculate_conversion_at_520nm(data_folder: str = DATA_FOLDER) -> Dict[str, U
     files_to_process = [f for f in absorbance_files if PATTERN_REFERENCE not in str(f)]
     
     # Check for existing conversion values to avoid reprocessing
-    existing_conversion_file = spectra_path / "conversion_values.txt"
-    already_processed = set()
-    if existing_conversion_file.exists():
-        try:
-            with open(existing_conversion_file, "r") as f:
-                lines = f.readlines()
-                for line in lines[1:]:  # Skip header
-                    if line.strip():
-                        filename = line.split('\t')[0]
-                        already_processed.add(filename)
-        except Exception as e:
-            logger.warning(f"Could not read existing conversion file: {e}")
-    
-    conversion_data = []
+    file_path = spectra_path / "conversion_values.txt"
+    conversion_log = read_conversion_log(file_path)
+    already_processed = conversion_log['processed']
+    
+    # Preallocated per-file columns, truncated to the files actually processed
+    num_files = len(files_to_process)
+    filenames = np.empty(num_files, dtype=object)
+    timestamps = np.empty(num_files, dtype=object)
+    absorbance_values = np.empty(num_files, dtype=np.float64)
+    is_t0 = np.zeros(num_files, dtype=bool)
+    count = 0
     
+    new_files = []
     for file in files_to_process:
         filename = Path(file).name
         if filename in already_processed:
             logger.info(f"Skipping {filename} - already processed")
             continue
-        
-        spectrum_data = load_spectrum_data(file)
+        new_files.append(file)
+    
+    # Load all new spectra in one batch and keep only the target absorbance of each
+    for file, spectrum_data in zip(new_files, map_files(_load_spectrum_cached, new_files)):
+        filename = Path(file).name
         if spectrum_data is not None and validate_spectrum_data(spectrum_data):
-            wavelengths = spectrum_data[:, 0]
-            absorbances = spectrum_data[:, 1]
-            if not np.array_equal(wavelengths, t0_wavelengths):
+            if not np.array_equal(spectrum_data[:, 0], t0_wavelengths):
                 logger.warning(f"Warning: Wavelength mismatch in {file}")
                 continue
-            absorbance_target = absorbances[wavelength_idx]
-            
-            # Calculate conversion: t0 = 0%, others = (1 - absorbance/t0_absorbance) * 100
-            if PATTERN_T0 in str(file):
-                conversion = 0.0  # t0 spectrum is 0% conversion
-            elif t0_absorbance_target > 0:
-                conversion = (1 - (absorbance_target / t0_absorbance_target)) * 100
-            else:
-                logger.warning(f"Warning: t0 absorbance at {actual_wavelength:.1f} nm is zero or negative")
-                conversion = 0.0
-            
-            conversion_data.append({
-                'filename': filename,
-                'absorbance': absorbance_target,
-                'conversion': conversion,
-                'file': file
-            })
+            filenames[count] = filename
+            timestamps[count] = extract_timestamp(file.stem)
+            absorbance_values[count] = spectrum_data[wavelength_idx, 1]
+            is_t0[count] = PATTERN_T0 in str(file)
+            count += 1
     
     # Sort by timestamp extracted from filename
-    conversion_data.sort(key=lambda x: extract_timestamp(Path(x['file']).stem))
-    if conversion_data:
-        file_path = spectra_path / "conversion_values.txt"
-        # Read existing data if file exists
-        existing_data = []
-        if file_path.exists():
-            try:
-                with open(file_path, "r") as f:
-                    lines = f.readlines()
-                    if lines:  # Keep header from existing file
-                        header = lines[0]
-                        for line in lines[1:]:
-                            if line.strip():
-                                parts = line.strip().split('\t')
-                                if len(parts) >= 3:
-                                    existing_data.append({
-                                        'filename': parts[0],
-                                        'absorbance': float(parts[1]),
-                                        'conversion': float(parts[2]),
-                                        'timestamp': extract_timestamp(parts[0])
-                                    })
-            except Exception as e:
-                logger.warning(f"Could not read existing conversion file: {e}")
-                header = HEADER_CONVERSION
-        else:
-            header = HEADER_CONVERSION
-        
-        # Combine existing and new data
-        all_data = existing_data + conversion_data
-        
-        # Sort all data by timestamp
-        def get_timestamp_for_sorting(item):
-            if 'timestamp' in item:
-                return item['timestamp']  # Existing data
-            else:
-                return extract_timestamp(Path(item['file']).stem)  # New data
-        
-        all_data.sort(key=get_timestamp_for_sorting)
-        
-        # Write all data back to file
-        with open(file_path, "w") as f:
-            f.write(header)
-            for row in all_data:
-                if 'file' in row:  # New data
-                    f.write(f"{row['filename']}\t{row['absorbance']:.6f}\t{row['conversion']:.2f}\n")
-                else:  # Existing data
-                    f.write(f"{row['filename']}\t{row['absorbance']:.6f}\t{row['conversion']:.2f}\n")
+    order = np.argsort(timestamps[:count], kind="stable")
+    filenames = filenames[order]
+    timestamps = timestamps[order]
+    absorbance_values = absorbance_values[order]
+    is_t0 = is_t0[order]
+    
+    # Calculate conversion: t0 = 0%, others = (1 - absorbance/t0_absorbance) * 100
+    if t0_absorbance_target > 0:
+        conversions = np.where(is_t0, 0.0, (1 - (absorbance_values / t0_absorbance_target)) * 100)
+    else:
+        if not np.all(is_t0):
+            logger.warning(f"Warning: t0 absorbance at {actual_wavelength:.1f} nm is zero or negative")
+        conversions = np.zeros(count)
+    
+    if count:
+        write_conversion_log(file_path, conversion_log,
+                             list(zip(filenames, absorbance_values, conversions, timestamps)))
         logger.info(f"Conversion data saved to {file_path}")
     
     return {
-        'filenames': [d['filename'] for d in conversion_data],
-        'absorbances': [d['absorbance'] for d in conversion_data],
-        'conversions': [d['conversion'] for d in conversion_data],
+        'filenames': filenames.tolist(),
+        'absorbances': absorbance_values.tolist(),
+        'conversions': conversions.tolist(),
         't0_absorbance': t0_absorbance_target,
         'wavelength': actual_wavelength
     }
 
 
+def find_unprocessed_spectra(spectra_path: Path, conversion_log: Dict) -> frozenset:
+    """
+    Find raw spectra the full pipeline has not finished processing.
+    
+    A raw spectrum (named like save_spectrum names them) counts as processed once its
+    '_neg_removed' file exists and, unless it is the reference, its '_absorbance' file
+    exists and is listed in conversion_values.txt. Only file names in the cached folder
+    listing are compared, and the result is kept with that listing until the folder or
+    the conversion log changes, so repeated calls do not touch the disk.
+    
+    Args:
+        spectra_path (Path): Path to the spectra folder.
+        conversion_log (dict): Conversion log of the folder, as returned by read_conversion_log.
+    
+    Returns:
+        frozenset: Names of the raw spectra that still need processing.
+    """
+    files = list_spectrum_files(spectra_path)
+    listing = _listing_cache.get(str(spectra_path))
+    cached = listing.get('unprocessed') if listing is not None else None
+    if cached is not None and cached['log_stat'] == conversion_log['stat']:
+        return cached['names']
+    
+    names = {f.name for f in files}
+    processed = conversion_log['processed']
+    unprocessed = set()
+    for name in names:
+        if not RAW_SPECTRUM_PATTERN.match(name):
+            continue
+        neg_removed_name = name[:-len(".txt")] + "_neg_removed.txt"
+        absorbance_name = neg_removed_name[:-len(".txt")] + "_absorbance.txt"
+        if neg_removed_name not in names or (PATTERN_REFERENCE not in name and (
+                absorbance_name not in names or absorbance_name not in processed)):
+            unprocessed.add(name)
+    unprocessed = frozenset(unprocessed)
+    if listing is not None:
+        listing['unprocessed'] = {'log_stat': conversion_log['stat'], 'names': unprocessed}
+    return unprocessed
+
+
+def process_new_spectrum(file_path: Path) -> Optional[float]:
+    """
+    Run negative removal, absorbance and conversion for one newly saved spectrum.
+    
+    Gives the same files and conversion_values.txt row as running
+    remove_negatives_from_spectra, calculate_absorbance and calculate_conversion_at_520nm,
+    but without rescanning the other spectra in the folder. Only possible once the reference
+    and t0 have been processed by the full pipeline and every other raw spectrum in the folder
+    has been processed too (see find_unprocessed_spectra).
+    
+    Args:
+        file_path (Path): Path to the raw spectrum just saved by save_spectrum.
+    
+    Returns:
+        float or None: Conversion in percent, or None if the reference, t0 or an earlier spectrum
+            is not processed yet or the spectrum cannot be used, in which case the full pipeline
+            should be run.
+    """
+    spectra_path = file_path.parent
+    ref_files = find_files_by_patterns(spectra_path, include_patterns=["_neg_removed", PATTERN_REFERENCE], exclude_patterns=["absorbance"])
+    t0_files = [f for f in find_files_by_pattern(spectra_path, PATTERN_ABSORBANCE) if PATTERN_T0 in str(f)]
+    if len(ref_files) == 0 or len(t0_files) == 0 or not is_output_up_to_date(t0_files[0], ref_files[0]):
+        return None
+    log_path = spectra_path / "conversion_values.txt"
+    conversion_log = read_conversion_log(log_path)
+    if t0_files[0].name not in conversion_log['processed']:
+        return None
+    # Earlier spectra left unprocessed (e.g. taken without calculate_conversion) need the full pipeline
+    if find_unprocessed_spectra(spectra_path, conversion_log) - {file_path.name}:
+        return None
+    
+    reference = get_reference_log(ref_files[0])
+    t0_reference = get_t0_reference(t0_files[0], TARGET_WAVELENGTH)
+    data = _load_spectrum_cached(file_path)
+    if reference is None or t0_reference is None or not validate_spectrum_data(data):
+        return None
+    # Data is guaranteed to be valid at this point
+    assert data is not None  # Help type checker
+    ref_wavelengths, log_reference = reference
+    t0_wavelengths, wavelength_idx, t0_absorbance_target = t0_reference
+    wavelengths = data[:, 0]
+    if not wavelengths_match(wavelengths, ref_wavelengths) or not np.array_equal(wavelengths, t0_wavelengths):
+        return None
+    
+    neg_removed_file = file_path.with_name(file_path.stem + "_neg_removed.txt")
+    intensities = zero_negatives(data[:, 1])
+    save_spectrum_file(neg_removed_file, wavelengths, intensities, HEADER_INTENSITY)
+    
+    absorbance_file = neg_removed_file.with_name(neg_removed_file.stem + "_absorbance.txt")
+    absorbance = _absorbance_kernel(intensities[np.newaxis, :], log_reference, MIN_REFERENCE_INTENSITY)[0]
+    save_spectrum_file(absorbance_file, wavelengths, absorbance, HEADER_ABSORBANCE)
+    logger.info(f"Absorbance spectrum saved to {absorbance_file}")
+    
+    # Read the value back from the saved file, which holds it rounded like the full pipeline sees it
+    saved_absorbance = _load_spectrum_cached(absorbance_file)
+    if not validate_spectrum_data(saved_absorbance):
+        return None
+    assert saved_absorbance is not None  # Help type checker
+    absorbance_target = saved_absorbance[wavelength_idx, 1]
+    if t0_absorbance_target > 0:
+        conversion = (1 - (absorbance_target / t0_absorbance_target)) * 100
+    else:
+        logger.warning(f"Warning: t0 absorbance at {t0_wavelengths[wavelength_idx]:.1f} nm is zero or negative")
+        conversion = 0.0
+    if absorbance_file.name not in conversion_log['processed']:
+        write_conversion_log(log_path, conversion_log, [(absorbance_file.name, absorbance_target, conversion,
+                                                         extract_timestamp(absorbance_file.stem))])
+    return float(conversion)
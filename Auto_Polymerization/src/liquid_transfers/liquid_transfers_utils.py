@@ -6,6 +6,7 @@ It includes wrappers for all hardware transfers and specialized functions for di
 
 Key Features:
 - Error-safe transfer functions with COM port conflict handling and exponential backoff
+- Transfers from concurrent threads are serialized instead of competing for the shared COM port
 - Specialized transfer functions for UV-VIS, NMR, modification, and cleaning workflows
 - Config-driven parameters for all transfer operations
 - Comprehensive logging and error reporting
@@ -13,6 +14,8 @@ Key Features:
 Core Functions:
 - serial_communication_error_safe_transfer_volumetric: Main error-safe wrapper for medusa.transfer_volumetric
 - retry_on_serial_com_error: Retry logic with exponential backoff for serial errors
+- request_shutdown / clear_shutdown_request: Cut short any retry backoff when the workflow is stopped,
+  and re-enable retries when a new workflow starts
 - UV-VIS/NMR/Modification/Cleaning transfer helpers: Workflow-specific transfer logic
 - Deoxygenation: Active gas pumping for reaction mixture deoxygenation
 
@@ -28,12 +31,32 @@ Date: [Current Date]
 Version: 1.0
 """
 
+import logging
+import threading
 import time
 from serial.serialutil import SerialException
 from users.config import platform_config as config
 
 
-def retry_on_serial_com_error(func, max_retries=3, initial_delay=120, max_delay=300, logger=None):
+# Used for retry messages when neither a logger nor a medusa logger is available
+_module_logger = logging.getLogger(__name__)
+
+# Default retry behaviour for COM port conflicts
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_INITIAL_DELAY = 120  # seconds
+DEFAULT_MAX_DELAY = 300  # seconds
+
+# Set by request_shutdown to cut short any retry backoff that is currently waiting,
+# cleared by clear_shutdown_request when a new workflow starts
+_shutdown_event = threading.Event()
+
+# All syringe pumps share one COM port (see fluidic_design_autopoly.json), so transfers started
+# from different threads of this process run one at a time instead of colliding on the port
+_transfer_lock = threading.Lock()
+
+
+def retry_on_serial_com_error(func, *args, max_retries=DEFAULT_MAX_RETRIES, initial_delay=DEFAULT_INITIAL_DELAY,
+                              max_delay=DEFAULT_MAX_DELAY, logger=None, **kwargs):
     """
     Retry a function that might fail due to COM port errors with exponential backoff.
     
@@ -43,10 +66,12 @@ def retry_on_serial_com_error(func, max_retries=3, initial_delay=120, max_delay=
     
     Args:
         func (callable): Function to retry
+        *args: Positional arguments passed to func on every attempt
         max_retries (int): Maximum number of retry attempts (default: 3)
         initial_delay (int): Initial delay in seconds (default: 120)
         max_delay (int): Maximum delay in seconds (default: 300)
-        logger (logging.Logger, optional): Logger instance for messages
+        logger (logging.Logger, optional): Logger instance for messages (default: this module's logger)
+        **kwargs: Keyword arguments passed to func on every attempt
         
     Returns:
         Any: Return value from the successful function call
@@ -54,54 +79,84 @@ def retry_on_serial_com_error(func, max_retries=3, initial_delay=120, max_delay=
     Raises:
         SerialException: If all retry attempts fail or for non-COM port errors
     """
+    logger = logger or _module_logger
     for attempt in range(max_retries + 1):
         try:
-            return func()
+            return func(*args, **kwargs)
         except SerialException as e:
-            if "PermissionError" in str(e) and "COM" in str(e):
+            if _is_com_port_conflict(e):
                 if attempt < max_retries:
                     delay = min(initial_delay * (2 ** attempt), max_delay)
-                    msg1 = f"❌ COM port error on attempt {attempt + 1}: {e}"
-                    msg2 = f"⏳ Waiting {delay} seconds before retry {attempt + 1}/{max_retries}..."
-                    if logger:
-                        logger.error(msg1)
-                        logger.info(msg2)
-                    else:
-                        print(msg1)
-                        print(msg2)
-                    time.sleep(delay)
+                    logger.error(f"❌ COM port error on attempt {attempt + 1}: {e}")
+                    logger.info(f"⏳ Waiting {delay} seconds before retry {attempt + 1}/{max_retries}...")
+                    # Interruptible wait, so request_shutdown does not have to sit out the backoff
+                    if _shutdown_event.wait(delay):
+                        logger.warning("Shutdown requested, abandoning COM port retry.")
+                        raise
                     continue
                 else:
-                    msg1 = f"❌ Failed after {max_retries + 1} attempts. Last error: {e}"
-                    msg2 = f"💡 This might indicate a hardware issue or persistent COM port conflict."
-                    if logger:
-                        logger.error(msg1)
-                        logger.warning(msg2)
-                    else:
-                        print(msg1)
-                        print(msg2)
+                    logger.error(f"❌ Failed after {max_retries + 1} attempts. Last error: {e}")
+                    logger.warning("💡 This might indicate a hardware issue or persistent COM port conflict.")
                     raise
             else:
-                msg = f"❌ Non-COM port serial error: {e}"
-                if logger:
-                    logger.error(msg)
-                else:
-                    print(msg)
+                logger.error(f"❌ Non-COM port serial error: {e}")
                 raise
 
 
-def serial_communication_error_safe_transfer_volumetric(medusa, logger=None, **kwargs):
+def request_shutdown():
+    """
+    Abort COM port retries that are waiting out their backoff, e.g. when the workflow is stopped.
+    
+    Waiting and later retries re-raise their SerialException instead of sleeping, so
+    threads blocked in a 2-5 minute backoff return promptly. Stays in effect until
+    clear_shutdown_request is called.
+    """
+    _shutdown_event.set()
+
+
+def clear_shutdown_request():
+    """
+    Re-enable COM port retries after request_shutdown, e.g. when a new workflow starts.
+    """
+    _shutdown_event.clear()
+
+
+def _is_com_port_conflict(error):
+    """
+    Check whether a SerialException means the COM port is in use by another thread or process.
+    
+    pyserial raises the SerialException without chaining the underlying OSError, so the
+    message it formats is the only signal, e.g.
+    "could not open port 'COM7': PermissionError(13, 'Access is denied.', None, 5)".
+    
+    Args:
+        error (SerialException): Exception raised by the transfer
+        
+    Returns:
+        bool: True if the error is a COM port permission conflict worth retrying
+    """
+    message = str(error)
+    return "PermissionError" in message and "COM" in message
+
+
+def serial_communication_error_safe_transfer_volumetric(medusa, logger=None, max_retries=DEFAULT_MAX_RETRIES,
+                                                         initial_delay=DEFAULT_INITIAL_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                                                         **kwargs):
     """
     Direct, parameter-preserving, error-safe wrapper for medusa.transfer_volumetric.
     
     This function wraps medusa.transfer_volumetric with robust error handling for
     COM port conflicts. All parameters are passed through unchanged, ensuring that
     no transfer logic or parameter names are altered. The only difference is the
-    addition of retry logic for serial communication errors.
+    addition of retry logic for serial communication errors. Transfers from
+    concurrent threads are serialized, since the syringe pumps share one COM port.
     
     Args:
         medusa: Medusa instance for hardware control
-        logger (logging.Logger, optional): Logger instance for error messages
+        logger (logging.Logger, optional): Logger instance for error messages (default: medusa.logger)
+        max_retries (int): Maximum number of retry attempts on COM port conflicts (default: 3)
+        initial_delay (int): Initial retry delay in seconds (default: 120)
+        max_delay (int): Maximum retry delay in seconds (default: 300)
         **kwargs: All parameters to pass to medusa.transfer_volumetric
         
     Returns:
@@ -110,12 +165,29 @@ def serial_communication_error_safe_transfer_volumetric(medusa, logger=None, **k
     Raises:
         SerialException: If all retry attempts fail
     """
-    def transfer_func():
+    # Report retries through the platform logger medusa was set up with
+    logger = logger or getattr(medusa, "logger", None)
+    return retry_on_serial_com_error(_locked_transfer_volumetric, medusa, max_retries=max_retries,
+                                     initial_delay=initial_delay, max_delay=max_delay, logger=logger, **kwargs)
+
+
+def _locked_transfer_volumetric(medusa, **kwargs):
+    """Run one medusa.transfer_volumetric call while holding the transfer lock."""
+    with _transfer_lock:
         return medusa.transfer_volumetric(**kwargs)
-    return retry_on_serial_com_error(transfer_func, logger=logger)
 
 
 
+# (source vessel, pump) for each path primed by prime_tubing, in priming order
+_PRIME_PLAN = (
+    ("Solvent_Vessel", "Solvent_Monomer_Modification_Pump"),
+    ("Monomer_Vessel", "Solvent_Monomer_Modification_Pump"),
+    ("Initiator_Vessel", "Initiator_CTA_Pump"),
+    ("CTA_Vessel", "Initiator_CTA_Pump"),
+    ("Modification_Vessel", "Solvent_Monomer_Modification_Pump"),
+)
+
+
 def prime_tubing(medusa, prime_transfer_params):
     """
     Prime tubing from each vessel to waste using the appropriate pumps.
@@ -136,57 +208,18 @@ def prime_tubing(medusa, prime_transfer_params):
     Returns:
         None: Priming operations are performed via error-safe transfer functions
     """
-    serial_communication_error_safe_transfer_volumetric(medusa, **{
-        "source": "Solvent_Vessel", "target": "Waste_Vessel", "pump_id": "Solvent_Monomer_Modification_Pump",
-        "transfer_type": prime_transfer_params.get("transfer_type", "liquid"),
-        "pre_rinse": prime_transfer_params.get("pre_rinse", 1), "pre_rinse_volume": prime_transfer_params.get("pre_rinse_volume", 1.0), "pre_rinse_speed": prime_transfer_params.get("pre_rinse_speed", 0.1),
-        "volume": prime_transfer_params.get("prime_volume", 1.0), "draw_speed": prime_transfer_params.get("draw_speed", 0.1), "dispense_speed": prime_transfer_params.get("dispense_speed", 0.1),
-        "flush": prime_transfer_params.get("flush", 1), "flush_volume": prime_transfer_params.get("flush_volume", 5), "flush_speed": prime_transfer_params.get("flush_speed", 0.1),
-        "post_rinse_vessel": prime_transfer_params.get("post_rinse_vessel", "Purge_Solvent_Vessel_1"), "post_rinse": prime_transfer_params.get("post_rinse", 1), "post_rinse_volume": prime_transfer_params.get("post_rinse_volume", 2.5),
-        "post_rinse_speed": prime_transfer_params.get("post_rinse_speed", 0.1)    
-    })
-
-    serial_communication_error_safe_transfer_volumetric(medusa, **{
-        "source": "Monomer_Vessel", "target": "Waste_Vessel", "pump_id": "Solvent_Monomer_Modification_Pump",
+    # Same parameters for every path; only the source vessel and pump differ
+    base_params = {
+        "target": "Waste_Vessel",
         "transfer_type": prime_transfer_params.get("transfer_type", "liquid"),
         "pre_rinse": prime_transfer_params.get("pre_rinse", 1), "pre_rinse_volume": prime_transfer_params.get("pre_rinse_volume", 1.0), "pre_rinse_speed": prime_transfer_params.get("pre_rinse_speed", 0.1),
         "volume": prime_transfer_params.get("prime_volume", 1.0), "draw_speed": prime_transfer_params.get("draw_speed", 0.1), "dispense_speed": prime_transfer_params.get("dispense_speed", 0.1),
         "flush": prime_transfer_params.get("flush", 1), "flush_volume": prime_transfer_params.get("flush_volume", 5), "flush_speed": prime_transfer_params.get("flush_speed", 0.1),
         "post_rinse_vessel": prime_transfer_params.get("post_rinse_vessel", "Purge_Solvent_Vessel_1"), "post_rinse": prime_transfer_params.get("post_rinse", 1), "post_rinse_volume": prime_transfer_params.get("post_rinse_volume", 2.5),
         "post_rinse_speed": prime_transfer_params.get("post_rinse_speed", 0.1)
-    })
-
-    serial_communication_error_safe_transfer_volumetric(medusa, **{
-        "source": "Initiator_Vessel", "target": "Waste_Vessel", "pump_id": "Initiator_CTA_Pump",
-        "transfer_type": prime_transfer_params.get("transfer_type", "liquid"),
-        "pre_rinse": prime_transfer_params.get("pre_rinse", 1), "pre_rinse_volume": prime_transfer_params.get("pre_rinse_volume", 1.0), "pre_rinse_speed": prime_transfer_params.get("pre_rinse_speed", 0.1),
-        "volume": prime_transfer_params.get("prime_volume", 1.0), "draw_speed": prime_transfer_params.get("draw_speed", 0.1), "dispense_speed": prime_transfer_params.get("dispense_speed", 0.1),
-        "flush": prime_transfer_params.get("flush", 1), "flush_volume": prime_transfer_params.get("flush_volume", 5), "flush_speed": prime_transfer_params.get("flush_speed", 0.1),
-        "post_rinse_vessel": prime_transfer_params.get("post_rinse_vessel", "Purge_Solvent_Vessel_1"), "post_rinse": prime_transfer_params.get("post_rinse", 1), "post_rinse_volume": prime_transfer_params.get("post_rinse_volume", 2.5),
-        "post_rinse_speed": prime_transfer_params.get("post_rinse_speed", 0.1)
-    })
-
-    serial_communication_error_safe_transfer_volumetric(medusa, **{
-        "source": "CTA_Vessel", "target": "Waste_Vessel", "pump_id": "Initiator_CTA_Pump",
-        "transfer_type": prime_transfer_params.get("transfer_type", "liquid"),
-        "pre_rinse": prime_transfer_params.get("pre_rinse", 1), "pre_rinse_volume": prime_transfer_params.get("pre_rinse_volume", 1.0), "pre_rinse_speed": prime_transfer_params.get("pre_rinse_speed", 0.1),
-        "volume": prime_transfer_params.get("prime_volume", 1.0), "draw_speed": prime_transfer_params.get("draw_speed", 0.1), "dispense_speed": prime_transfer_params.get("dispense_speed", 0.1),
-        "flush": prime_transfer_params.get("flush", 1), "flush_volume": prime_transfer_params.get("flush_volume", 5), "flush_speed": prime_transfer_params.get("flush_speed", 0.1),
-        "post_rinse_vessel": prime_transfer_params.get("post_rinse_vessel", "Purge_Solvent_Vessel_1"), "post_rinse": prime_transfer_params.get("post_rinse", 1), "post_rinse_volume": prime_transfer_params.get("post_rinse_volume", 2.5),
-        "post_rinse_speed": prime_transfer_params.get("post_rinse_speed", 0.1)
-    })
-
-    serial_communication_error_safe_transfer_volumetric(medusa, **{
-        "source": "Modification_Vessel", "target": "Waste_Vessel", "pump_id": "Solvent_Monomer_Modification_Pump",
-        "transfer_type": prime_transfer_params.get("transfer_type", "liquid"),
-        "pre_rinse": prime_transfer_params.get("pre_rinse", 1), "pre_rinse_volume": prime_transfer_params.get("pre_rinse_volume", 1.0), "pre_rinse_speed": prime_transfer_params.get("pre_rinse_speed", 0.1),
-        "volume": prime_transfer_params.get("prime_volume", 1.0), "draw_speed": prime_transfer_params.get("draw_speed", 0.1), "dispense_speed": prime_transfer_params.get("dispense_speed", 0.1),
-        "flush": prime_transfer_params.get("flush", 1), "flush_volume": prime_transfer_params.get("flush_volume", 5), "flush_speed": prime_transfer_params.get("flush_speed", 0.1),
-        "post_rinse_vessel": prime_transfer_params.get("post_rinse_vessel", "Purge_Solvent_Vessel_1"), "post_rinse": prime_transfer_params.get("post_rinse", 1), "post_rinse_volume": prime_transfer_params.get("post_rinse_volume", 2.5),
-        "post_rinse_speed": prime_transfer_params.get("post_rinse_speed", 0.1)        
-    })
-
-
+    }
+    for source, pump_id in _PRIME_PLAN:
+        serial_communication_error_safe_transfer_volumetric(medusa, source=source, pump_id=pump_id, **base_params)
 
 
 def add_modification_reagent_transfer(medusa):
@@ -246,22 +279,26 @@ def deoxygenate_reaction_mixture(medusa, deoxygenation_time_sec, pump_id="Solven
     try:
         medusa.logger.info(f"Starting deoxygenation for {deoxygenation_time_sec} seconds using pump {pump_id}...")
         
+        # Every gas pulse is the same transfer, so its parameters are built once
+        gas_pulse_params = dict(
+            source="Gas_Reservoir_Vessel", 
+            target="Reaction_Vial", 
+            pump_id=pump_id, 
+            volume=10, draw_speed=0.25, dispense_speed=0.1,
+            transfer_type="gas", 
+            flush=1, flush_speed=0.25, flush_volume=10,
+        )
+        
         # Open gas valve
         medusa.write_serial("Gas_Valve", "GAS_ON")
         
         # Active deoxygenation: pump gas through system in intervals
-        start_time = time.time()
-        while time.time() - start_time < deoxygenation_time_sec:
-            serial_communication_error_safe_transfer_volumetric(
-                medusa,
-                source="Gas_Reservoir_Vessel", 
-                target="Reaction_Vial", 
-                pump_id=pump_id, 
-                volume=10, draw_speed=0.25, dispense_speed=0.1,
-                transfer_type="gas", 
-                flush=1, flush_speed=0.25, flush_volume=10,
-                
-            )
+        # Monotonic clock, so wall-clock adjustments cannot shorten or extend deoxygenation
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < deoxygenation_time_sec:
+            # Short retries only: the gas valve stays open while waiting out a COM port conflict
+            serial_communication_error_safe_transfer_volumetric(medusa, max_retries=1, initial_delay=1, max_delay=2,
+                                                                **gas_pulse_params)
             time.sleep(1)  # 1-second intervals
         
         # Close gas valve
@@ -550,6 +587,15 @@ def nmr_flush_gas_cleaning(medusa):
 
 
 
+# (purge solvent vessel, pump) for each line flushed into the reaction vial during cleaning
+_CLEAN_REACTION_VIAL_PLAN = (
+    ("Purge_Solvent_Vessel_1", "Solvent_Monomer_Modification_Pump"),
+    ("Purge_Solvent_Vessel_1", "Precipitation_Pump"),
+    ("Purge_Solvent_Vessel_1", "Initiator_CTA_Pump"),
+    ("Purge_Solvent_Vessel_2", "Analytical_Pump"),
+)
+
+
 def clean_reaction_vial_transfers_to_vial(medusa):
     """
     Dispense purge solvent to reaction vial to clean it
@@ -561,32 +607,12 @@ def clean_reaction_vial_transfers_to_vial(medusa):
     Returns:
         None: Dispenses are performed via error-safe transfer functions
     """
-    serial_communication_error_safe_transfer_volumetric(medusa, **{
-        "source": "Purge_Solvent_Vessel_1", "target": "Reaction_Vial", "pump_id": "Solvent_Monomer_Modification_Pump",
-        "transfer_type": "liquid",
-        "volume": config.cleaning_params.get("cleaning_volume_each_pump", 6.0), "draw_speed": config.cleaning_params.get("draw_speed_each_pump", 0.1), "dispense_speed": config.cleaning_params.get("dispense_speed_each_pump", 0.1),
-        "flush": config.cleaning_params.get("flush_times_each_pump", 1), "flush_volume": config.cleaning_params.get("flush_volume_each_pump", 5),  
-    })
-
-    serial_communication_error_safe_transfer_volumetric(medusa, **{
-        "source": "Purge_Solvent_Vessel_1", "target": "Reaction_Vial", "pump_id": "Precipitation_Pump",
-        "transfer_type": "liquid",
-        "volume": config.cleaning_params.get("cleaning_volume_each_pump", 6.0), "draw_speed": config.cleaning_params.get("draw_speed_each_pump", 0.1), "dispense_speed": config.cleaning_params.get("dispense_speed_each_pump", 0.1),
-        "flush": config.cleaning_params.get("flush_times_each_pump", 1), "flush_volume": config.cleaning_params.get("flush_volume_each_pump", 5),  
-    })
-
-    serial_communication_error_safe_transfer_volumetric(medusa, **{
-        "source": "Purge_Solvent_Vessel_1", "target": "Reaction_Vial", "pump_id": "Initiator_CTA_Pump",
-        "transfer_type": "liquid",
-        "volume": config.cleaning_params.get("cleaning_volume_each_pump", 6.0), "draw_speed": config.cleaning_params.get("draw_speed_each_pump", 0.1), "dispense_speed": config.cleaning_params.get("dispense_speed_each_pump", 0.1),
-        "flush": config.cleaning_params.get("flush_times_each_pump", 1), "flush_volume": config.cleaning_params.get("flush_volume_each_pump", 5), 
-    })
-
-    serial_communication_error_safe_transfer_volumetric(medusa, **{
-        "source": "Purge_Solvent_Vessel_2", "target": "Reaction_Vial", "pump_id": "Analytical_Pump",
+    params = config.cleaning_params
+    base_params = {
+        "target": "Reaction_Vial",
         "transfer_type": "liquid",
-        "volume": config.cleaning_params.get("cleaning_volume_each_pump", 6.0), "draw_speed": config.cleaning_params.get("draw_speed_each_pump", 0.1), "dispense_speed": config.cleaning_params.get("dispense_speed_each_pump", 0.1),
-        "flush": config.cleaning_params.get("flush_times_each_pump", 1), "flush_volume": config.cleaning_params.get("flush_volume_each_pump", 5),  
-    })
-
-   
\ No newline at end of file
+        "volume": params.get("cleaning_volume_each_pump", 6.0), "draw_speed": params.get("draw_speed_each_pump", 0.1), "dispense_speed": params.get("dispense_speed_each_pump", 0.1),
+        "flush": params.get("flush_times_each_pump", 1), "flush_volume": params.get("flush_volume_each_pump", 5),
+    }
+    for source, pump_id in _CLEAN_REACTION_VIAL_PLAN:
+        serial_communication_error_safe_transfer_volumetric(medusa, source=source, pump_id=pump_id, **base_params)
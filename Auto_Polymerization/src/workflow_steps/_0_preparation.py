@@ -41,7 +41,9 @@ The retry mechanism:
 - Provides clear logging of retry attempts and delays
 
 This approach allows the parallel preparation workflow (NMR shimming + other prep steps) to
-run without COM port conflicts, automatically waiting for transfers to complete before retrying.
+run without COM port conflicts. Transfers from the two threads are serialized by
+serial_communication_error_safe_transfer_volumetric, so one thread waits for the other's
+transfer to finish; the retry logic covers conflicts with other processes.
 
 Dependencies:
 - medusa: Hardware control framework
@@ -170,9 +172,10 @@ def run_preparation_workflow(
     different addresses. To handle potential COM port conflicts, all transfer_volumetric
     calls use serial_communication_error_safe_transfer_volumetric with retry logic.
     
-    The retry mechanism ensures that if one thread is using the COM port, the other thread
-    will automatically wait and retry with exponential backoff (2 min, 4 min, 5 min max),
-    rather than crashing with a PermissionError.
+    Transfers from the two threads are serialized, so if one thread is using the COM port,
+    the other thread waits for that transfer to finish rather than crashing with a
+    PermissionError. The retry mechanism with exponential backoff (2 min, 4 min, 5 min max)
+    remains for conflicts with other processes.
 
     Args:
         medusa: Medusa instance
@@ -193,8 +196,8 @@ def run_preparation_workflow(
         COM PORT CONFLICT RESOLUTION:
         - NMR shimming and tubing priming run in parallel
         - Both use syringe pumps that may share the same COM port
-        - serial_communication_error_safe_transfer_volumetric handles conflicts with automatic retry
-        - No manual synchronization needed - the retry logic handles it automatically
+        - serial_communication_error_safe_transfer_volumetric serializes transfers between threads
+        - No manual synchronization needed - other processes are handled by the retry logic
     """
 
     if run_minimal_test:
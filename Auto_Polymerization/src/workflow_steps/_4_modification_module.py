@@ -288,6 +288,9 @@ def monitor_modification_reaction(medusa: Medusa, modification_params: Dict) ->
                 except Exception as retry_e:
                     medusa.logger.error(f"Retry {retry + 1} failed: {str(retry_e)}")
     
+    # Monitoring is over; release the spectrometer kept open between measurements
+    uv_vis.shutdown_spectrometer()
+    
     if iteration >= max_iterations:
         medusa.logger.warning(f"Modification monitoring stopped after {max_iterations} iterations")
         if final_conversion is not None:
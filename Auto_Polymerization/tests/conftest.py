@@ -0,0 +1,41 @@
+"""
+Shared pytest configuration for the Auto_Polymerization test suite.
+
+- Puts src/UV_VIS on the import path so test_uv_vis_utils.py can import uv_vis_utils directly.
+- Registers the 'hardware' marker for tests that need a connected instrument. These are
+  skipped unless pytest is run with --run-hardware.
+
+Usage:
+    pytest tests                            # hardware tests skipped
+    pytest tests --run-hardware             # include hardware tests
+
+The data-processing tests in test_uv_vis_utils.py share the real spectra folder and
+the plot tests rely on running after them, so the suite is not run in parallel.
+"""
+
+import os
+import sys
+
+import pytest
+
+UV_VIS_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'UV_VIS'))
+if UV_VIS_SRC not in sys.path:
+    sys.path.insert(0, UV_VIS_SRC)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-hardware", action="store_true", default=False,
+                     help="run tests that require connected hardware (e.g. the CCS200 spectrometer)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "hardware: test requires connected hardware (enable with --run-hardware)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-hardware"):
+        return
+    skip_hardware = pytest.mark.skip(reason="needs connected hardware, use --run-hardware to run")
+    for item in items:
+        if "hardware" in item.keywords:
+            item.add_marker(skip_hardware)
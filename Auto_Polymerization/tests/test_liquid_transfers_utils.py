@@ -0,0 +1,77 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+import time
+import pytest
+
+serialutil = pytest.importorskip("serial.serialutil")
+import src.liquid_transfers.liquid_transfers_utils as lt_utils
+
+# Message pyserial formats when another thread or process holds the COM port
+COM_PORT_BUSY = "could not open port 'COM7': PermissionError(13, 'Access is denied.', None, 5)"
+
+class MockLogger:
+    def info(self, msg): print(f"[INFO] {msg}")
+    def warning(self, msg): print(f"[WARNING] {msg}")
+    def error(self, msg): print(f"[ERROR] {msg}")
+
+class BusyPortMedusa:
+    """Mock medusa whose transfers fail with a COM port conflict for the first `failures` calls."""
+    def __init__(self, failures):
+        self.logger = MockLogger()
+        self.failures = failures
+        self.transfer_volumetric_calls = []
+    def transfer_volumetric(self, **kwargs):
+        self.transfer_volumetric_calls.append(kwargs)
+        if len(self.transfer_volumetric_calls) <= self.failures:
+            raise serialutil.SerialException(COM_PORT_BUSY)
+        return "done"
+
+
+def test_request_shutdown_interrupts_backoff():
+    medusa = BusyPortMedusa(failures=10)
+    errors = []
+
+    def transfer():
+        try:
+            lt_utils.serial_communication_error_safe_transfer_volumetric(medusa, source="A", target="B", volume=1)
+        except serialutil.SerialException as e:
+            errors.append(e)
+
+    lt_utils.clear_shutdown_request()
+    try:
+        worker = threading.Thread(target=transfer)
+        worker.start()
+        time.sleep(0.2)  # let the transfer fail and enter the 120 s backoff
+        start = time.monotonic()
+        lt_utils.request_shutdown()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+        assert time.monotonic() - start < 5
+        assert len(errors) == 1
+        assert len(medusa.transfer_volumetric_calls) == 1
+    finally:
+        lt_utils.clear_shutdown_request()
+
+
+def test_clear_shutdown_request_restores_retries():
+    lt_utils.request_shutdown()
+    lt_utils.clear_shutdown_request()
+    medusa = BusyPortMedusa(failures=2)
+    result = lt_utils.serial_communication_error_safe_transfer_volumetric(
+        medusa, initial_delay=0.01, max_delay=0.01, source="A", target="B", volume=1)
+    assert result == "done"
+    assert len(medusa.transfer_volumetric_calls) == 3
+
+
+def test_non_com_port_error_is_not_retried():
+    class BrokenMedusa(BusyPortMedusa):
+        def transfer_volumetric(self, **kwargs):
+            self.transfer_volumetric_calls.append(kwargs)
+            raise serialutil.SerialException("device reports an error")
+
+    medusa = BrokenMedusa(failures=0)
+    with pytest.raises(serialutil.SerialException):
+        lt_utils.serial_communication_error_safe_transfer_volumetric(medusa, source="A", target="B", volume=1)
+    assert len(medusa.transfer_volumetric_calls) == 1
@@ -6,10 +6,12 @@ including negative value removal, absorbance calculation, conversion calculation
 file operations, and plotting. It also includes diagnostic functions to help debug file discovery issues.
 
 Usage:
-    python test_uv_vis_utils.py
+    pytest tests/test_uv_vis_utils.py
+    pytest tests/test_uv_vis_utils.py --run-hardware   # include spectrometer tests
+    SHOW_PLOTS=1 pytest -s tests/test_uv_vis_utils.py  # display plots and pause after each one
 
 Requirements:
-    - Place this script in the same directory as uv_vis_utils.py or ensure it is on the Python path.
+    - uv_vis_utils.py is put on the Python path by tests/conftest.py.
     - Ensure your data folder (see DATA_FOLDER in uv_vis_utils.py) contains appropriate test spectra.
     - For take_spectrum test, hardware must be connected (or simulate with reference=True).
 
@@ -42,29 +44,110 @@ from uv_vis_utils import (
     validate_spectrum_data,
     save_spectrum_file,
     zero_negatives,
+    zero_negatives_inplace,
     extract_timestamp,
     find_wavelength_index,
     get_timestamp,
     generate_filename,
     take_spectrum,
     check_absorbance_stability,
+    process_new_spectrum,
     DATA_FOLDER,
     TARGET_WAVELENGTH,
     PATTERN_REFERENCE,
     PATTERN_T0,
     PATTERN_ABSORBANCE,
-    PATTERN_NEG_REMOVED
+    PATTERN_NEG_REMOVED,
+    HEADER_INTENSITY,
+    FMT_SPECTRUM
 )
 import numpy as np
 import logging
-import matplotlib.pyplot as plt
+import io
+import hashlib
+from functools import lru_cache
 from pathlib import Path
 import tempfile
+import shutil
 import os
+import re
+import pytest
+import matplotlib
+
+# Plots are rendered off-screen unless SHOW_PLOTS is set, so headless runs never
+# initialise a GUI backend or block on input()
+SHOW_PLOTS = bool(os.environ.get("SHOW_PLOTS"))
+if not SHOW_PLOTS:
+    matplotlib.use("Agg")
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Spectrum type patterns reported by debug_spectra_folder
+_DEBUG_PATTERNS = (PATTERN_REFERENCE, PATTERN_T0, PATTERN_ABSORBANCE, PATTERN_NEG_REMOVED)
+
+# Full-string timestamp format produced by get_timestamp (YYYY-MM-DD_HH-MM-SS)
+_TIMESTAMP_RE = re.compile(r'^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$')
+
+# Timestamp embedded in spectrum filenames (same format extract_timestamp looks for)
+_TIMESTAMP_SEARCH_RE = re.compile(r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})')
+
+# Key of the raw/original spectra bucket returned by _classify_spectra
+RAW_SPECTRA = "raw"
+
+# Substrings that mark a .txt file in the spectra folder as not being a raw spectrum
+_RAW_EXCLUDE_PATTERNS = (PATTERN_NEG_REMOVED, PATTERN_ABSORBANCE, PATTERN_REFERENCE, PATTERN_T0, "conversion_values")
+
+
+@lru_cache(maxsize=1)
+def _classify_spectra():
+    """
+    Sort the spectra folder into the buckets used by the plotting tests in one scandir pass.
+
+    The listing is taken on first use and shared by all plot tests, which run after
+    the data processing tests have written their output files.
+
+    Returns:
+        dict: Lists of file paths keyed by PATTERN_NEG_REMOVED, PATTERN_ABSORBANCE and RAW_SPECTRA
+    """
+    buckets = {PATTERN_NEG_REMOVED: [], PATTERN_ABSORBANCE: [], RAW_SPECTRA: []}
+    spectra_path = get_spectra_path()
+    if not spectra_path.exists():
+        return buckets
+    with os.scandir(spectra_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".txt"):
+                continue
+            # Absorbance spectra are also neg_removed, so a file can land in both buckets
+            if PATTERN_NEG_REMOVED in name:
+                buckets[PATTERN_NEG_REMOVED].append(entry.path)
+            if PATTERN_ABSORBANCE in name:
+                buckets[PATTERN_ABSORBANCE].append(entry.path)
+            if not any(pattern in name for pattern in _RAW_EXCLUDE_PATTERNS):
+                buckets[RAW_SPECTRA].append(entry.path)
+    return buckets
+
+
+def _finish_plot():
+    """Show the current figure and wait for the user, or render it off-screen and close it."""
+    import matplotlib.pyplot as plt
+    if SHOW_PLOTS:
+        plt.show(block=False)
+        input("Press Enter to continue...")
+    else:
+        plt.savefig(io.BytesIO(), format="png")
+        plt.close()
+
+
+def _file_digest(path, chunk_size=65536):
+    """Stream a file through BLAKE2b and return its digest, without holding the whole file in memory."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.digest()
+
 
 def test_get_timestamp():
     """Test timestamp generation."""
@@ -76,9 +159,7 @@ def test_get_timestamp():
     assert timestamp.count('-') == 4, f"Expected 4 hyphens, got {timestamp.count('-')} in '{timestamp}'"
     assert timestamp.count('_') == 1, f"Expected 1 underscore, got {timestamp.count('_')} in '{timestamp}'"
     # Verify the format matches the expected pattern
-    import re
-    pattern = r'^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$'
-    assert re.match(pattern, timestamp), f"Timestamp '{timestamp}' doesn't match expected format YYYY-MM-DD_HH-MM-SS"
+    assert _TIMESTAMP_RE.match(timestamp), f"Timestamp '{timestamp}' doesn't match expected format YYYY-MM-DD_HH-MM-SS"
     logger.info(f"Generated timestamp: {timestamp}")
 
 
@@ -122,11 +203,11 @@ def test_find_files_by_pattern():
     
     # Test with a pattern that might exist
     files = find_files_by_pattern(spectra_path, "txt")
-    assert isinstance(files, np.ndarray)
+    assert type(files) is np.ndarray
     
     # Test with a pattern that likely doesn't exist
     no_files = find_files_by_pattern(spectra_path, "nonexistent_pattern")
-    assert isinstance(no_files, np.ndarray)
+    assert type(no_files) is np.ndarray
     assert len(no_files) == 0
     
     logger.info(f"Found {len(files)} files with 'txt' pattern")
@@ -160,18 +241,24 @@ def test_zero_negatives():
     test_array = np.array([1.0, -2.0, 3.0, -4.0, 5.0])
     result = zero_negatives(test_array)
     expected = np.array([1.0, 0.0, 3.0, 0.0, 5.0])
-    np.testing.assert_array_equal(result, expected)
+    assert np.array_equal(result, expected), f"Expected {expected}, got {result}"
     
     # Test with all positive values
     positive_array = np.array([1.0, 2.0, 3.0])
     result = zero_negatives(positive_array)
-    np.testing.assert_array_equal(result, positive_array)
+    assert np.array_equal(result, positive_array), f"Expected {positive_array}, got {result}"
     
     # Test with all negative values
     negative_array = np.array([-1.0, -2.0, -3.0])
     result = zero_negatives(negative_array)
     expected = np.array([0.0, 0.0, 0.0])
-    np.testing.assert_array_equal(result, expected)
+    assert np.array_equal(result, expected), f"Expected {expected}, got {result}"
+    
+    # In-place variant modifies and returns the same array
+    inplace_array = np.array([1.0, -2.0, 3.0])
+    result = zero_negatives_inplace(inplace_array)
+    assert result is inplace_array
+    assert np.array_equal(inplace_array, np.array([1.0, 0.0, 3.0])), f"Got {inplace_array}"
     
     logger.info("Negative value removal tests passed.")
 
@@ -197,7 +284,7 @@ def test_find_wavelength_index():
     """Test wavelength index finding."""
     logger.info("Testing wavelength index finding...")
     
-    wavelengths = np.array([500, 510, 520, 530, 540])
+    wavelengths = np.arange(500, 550, 10, dtype=np.int64)
     
     # Test exact match
     idx = find_wavelength_index(wavelengths, 520)
@@ -211,6 +298,10 @@ def test_find_wavelength_index():
     idx = find_wavelength_index(wavelengths)
     assert idx == 2  # Should find 520
     
+    # Test targets outside the wavelength range
+    assert find_wavelength_index(wavelengths, 400) == 0
+    assert find_wavelength_index(wavelengths, 600) == 4
+    
     logger.info("Wavelength index finding tests passed.")
 
 
@@ -252,16 +343,54 @@ def test_save_spectrum_file():
         # Check file exists
         assert file_path.exists()
         
-        # Check file content
-        with open(file_path, 'r') as f:
-            content = f.read()
-            assert header in content
-            assert "500.0000" in content
-            assert "1.000000" in content
+        # Check file content (bytes-level search, no text decoding)
+        content = file_path.read_bytes()
+        assert header.encode() in content
+        assert b"500.0000" in content
+        assert b"1.000000" in content
         
         logger.info("Spectrum file saving tests passed.")
 
 
+def test_sidecar_matches_text():
+    """Test that spectra with and without a .npy sidecar load to the same values."""
+    logger.info("Testing mixed text-only and sidecar spectra...")
+    rng = np.random.default_rng(1)
+    wavelengths = np.linspace(200, 1000, 200) + rng.uniform(0, 1e-3, 200)
+    reference = 1000 + rng.normal(0, 5, wavelengths.size)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        # Reference and t0 written as text only, like folders processed before sidecars existed
+        for name, intensities in [("2025-01-01_00-00-00_UV_VIS_reference_spectrum.txt", reference),
+                                  ("2025-01-01_00-01-00_UV_VIS_t0_spectrum.txt", reference * 0.5)]:
+            np.savetxt(temp_path / name, np.column_stack((wavelengths, intensities)),
+                       header=HEADER_INTENSITY, fmt=FMT_SPECTRUM)
+        new_file = temp_path / "2025-01-01_00-02-00_UV_VIS_spectrum.txt"
+        save_spectrum_file(new_file, wavelengths, reference * 0.6, HEADER_INTENSITY, FMT_SPECTRUM)
+        
+        assert new_file.with_suffix(".npy").exists()
+        assert np.array_equal(load_spectrum_data(new_file), np.loadtxt(new_file, skiprows=1))
+        
+        remove_negatives_from_spectra(str(temp_path))
+        calculate_absorbance(str(temp_path))
+        results = calculate_conversion_at_520nm(str(temp_path))
+        assert results['filenames'] == ["2025-01-01_00-01-00_UV_VIS_t0_spectrum_neg_removed_absorbance.txt",
+                                        "2025-01-01_00-02-00_UV_VIS_spectrum_neg_removed_absorbance.txt"]
+    
+    logger.info("Sidecar and text-only spectra load identically.")
+
+
+def test_load_spectrum_data_returns_private_copy():
+    """Test that callers can edit loaded spectra without touching the cached copy."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "2025-01-01_00-00-00_UV_VIS_spectrum.txt"
+        save_spectrum_file(file_path, np.array([500.0, 510.0]), np.array([1.0, 2.0]), HEADER_INTENSITY)
+        data = load_spectrum_data(file_path)
+        data[:, 1] -= 1.0
+        assert np.array_equal(load_spectrum_data(file_path)[:, 1], [1.0, 2.0])
+
+
 def test_remove_negatives():
     """Test negative value removal preprocessing."""
     logger.info("Testing negative value removal preprocessing...")
@@ -279,11 +408,30 @@ def test_calculate_absorbance():
     results = calculate_absorbance()
     if results:
         logger.info(f"Absorbance calculation successful for {len(results)} spectra.")
-        assert all(isinstance(r, np.ndarray) for r in results)
+        assert all(type(r) is np.ndarray for r in results)
     else:
         logger.warning("Absorbance calculation failed or no spectra found.")
 
 
+def test_calculate_absorbance_repeatable():
+    """Test that absorbance results do not depend on whether outputs were already saved."""
+    rng = np.random.default_rng(2)
+    wavelengths = np.linspace(200, 1000, 200)
+    reference = 1000 + rng.normal(0, 5, wavelengths.size)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        for name, intensities in [("2025-01-01_00-00-00_UV_VIS_reference_spectrum.txt", reference),
+                                  ("2025-01-01_00-02-00_UV_VIS_spectrum.txt", reference * 0.6)]:
+            save_spectrum_file(temp_path / name, wavelengths, intensities, HEADER_INTENSITY, FMT_SPECTRUM)
+        remove_negatives_from_spectra(str(temp_path))
+        first = calculate_absorbance(str(temp_path))
+        second = calculate_absorbance(str(temp_path))
+        assert len(first) == len(second) == 1
+        assert np.array_equal(first[0], second[0])
+        assert first[0].flags.writeable and second[0].flags.writeable
+
+
 def test_calculate_conversion():
     """Test conversion calculation at 520 nm."""
     logger.info("Testing conversion calculation at 520 nm...")
@@ -304,6 +452,7 @@ def test_calculate_conversion():
         logger.warning("Conversion calculation failed or no absorbance spectra found.")
 
 
+@pytest.mark.hardware
 def test_take_spectrum():
     """Test spectrum acquisition (take_spectrum)."""
     logger.info("Testing spectrum acquisition (take_spectrum)...")
@@ -313,8 +462,8 @@ def test_take_spectrum():
         if spectrum is not None and wavelengths is not None:
             logger.info(f"Reference spectrum acquired and saved as {filename}.")
             logger.info(f"Spectrum shape: {spectrum.shape}, Wavelengths shape: {wavelengths.shape}")
-            assert isinstance(spectrum, np.ndarray)
-            assert isinstance(wavelengths, np.ndarray)
+            assert type(spectrum) is np.ndarray
+            assert type(wavelengths) is np.ndarray
             assert isinstance(filename, str)
             assert conversion is None  # Reference spectra don't have conversion
             assert reaction_complete is False  # Reference spectra don't check stability
@@ -324,6 +473,29 @@ def test_take_spectrum():
         logger.error(f"Error during spectrum acquisition: {e}")
 
 
+def test_spectrometer_wavelengths_read_only(monkeypatch):
+    """Test that the cached wavelength grid cannot be changed through the returned array."""
+    import uv_vis_utils
+    
+    class FakeSpectrometer:
+        def __init__(self):
+            self.grid = np.linspace(200, 1000, 5)
+        def get_wavelength_data(self):
+            return self.grid
+        def close_instrument(self):
+            pass
+    
+    fake = FakeSpectrometer()
+    monkeypatch.setattr(uv_vis_utils, "_spectrometer", fake)
+    monkeypatch.setattr(uv_vis_utils, "_spectrometer_wavelengths", None)
+    wavelengths = uv_vis_utils.get_spectrometer_wavelengths()
+    with pytest.raises(ValueError):
+        wavelengths *= 10
+    assert np.array_equal(uv_vis_utils.get_spectrometer_wavelengths(), np.linspace(200, 1000, 5))
+    fake.grid *= 10  # the driver's own array stays independent of the cached grid
+    assert np.array_equal(uv_vis_utils.get_spectrometer_wavelengths(), np.linspace(200, 1000, 5))
+
+
 def test_check_absorbance_stability():
     """Test absorbance stability checking."""
     logger.info("Testing absorbance stability checking...")
@@ -337,9 +509,9 @@ def test_check_absorbance_stability():
 
 def test_plot_first_neg_removed():
     """Test plotting of first _neg_removed spectrum."""
+    import matplotlib.pyplot as plt
     logger.info("Testing plotting of first _neg_removed spectrum...")
-    spectra_path = get_spectra_path()
-    neg_removed_files = find_files_by_pattern(spectra_path, PATTERN_NEG_REMOVED)
+    neg_removed_files = _classify_spectra()[PATTERN_NEG_REMOVED]
     if len(neg_removed_files) > 0:
         data = load_spectrum_data(neg_removed_files[0])
         if validate_spectrum_data(data) and data is not None:
@@ -351,20 +523,19 @@ def test_plot_first_neg_removed():
             plt.ylabel("Intensity (a.u.)")
             plt.title("First _neg_removed Spectrum")
             plt.grid(True)
-            plt.show(block=False)
-            logger.info("Plot displayed for first _neg_removed spectrum.")
+            _finish_plot()
+            logger.info("Plot rendered for first _neg_removed spectrum.")
         else:
             logger.warning("Failed to load first _neg_removed spectrum.")
     else:
         logger.warning("No _neg_removed spectra found for plotting.")
-    input("Press Enter to continue...")
 
 
 def test_plot_first_absorbance():
     """Test plotting of first absorbance spectrum."""
+    import matplotlib.pyplot as plt
     logger.info("Testing plotting of first absorbance spectrum...")
-    spectra_path = get_spectra_path()
-    absorbance_files = find_files_by_pattern(spectra_path, PATTERN_ABSORBANCE)
+    absorbance_files = _classify_spectra()[PATTERN_ABSORBANCE]
     if len(absorbance_files) > 0:
         data = load_spectrum_data(absorbance_files[0])
         if validate_spectrum_data(data) and data is not None:
@@ -376,23 +547,19 @@ def test_plot_first_absorbance():
             plt.ylabel("Absorbance (a.u.)")
             plt.title("First Absorbance Spectrum")
             plt.grid(True)
-            plt.show(block=False)
-            logger.info("Plot displayed for first absorbance spectrum.")
+            _finish_plot()
+            logger.info("Plot rendered for first absorbance spectrum.")
         else:
             logger.warning("Failed to load first absorbance spectrum.")
     else:
         logger.warning("No absorbance spectra found for plotting.")
-    input("Press Enter to continue...")
 
 
 def test_plot_first_raw():
     """Test plotting of first raw/original spectrum."""
+    import matplotlib.pyplot as plt
     logger.info("Testing plotting of first raw/original spectrum...")
-    spectra_path = get_spectra_path()
-    all_txt_files = list(spectra_path.glob("*.txt"))
-    # Exclude files that are not raw/original
-    exclude_patterns = [PATTERN_NEG_REMOVED, PATTERN_REFERENCE, PATTERN_T0, PATTERN_ABSORBANCE]
-    raw_files = [f for f in all_txt_files if not any(pat in str(f) for pat in exclude_patterns)]
+    raw_files = _classify_spectra()[RAW_SPECTRA]
     if len(raw_files) > 0:
         data = load_spectrum_data(raw_files[0])
         if validate_spectrum_data(data) and data is not None:
@@ -404,15 +571,15 @@ def test_plot_first_raw():
             plt.ylabel("Intensity (a.u.)")
             plt.title("First Raw Spectrum")
             plt.grid(True)
-            plt.show(block=False)
-            logger.info("Plot displayed for first raw/original spectrum.")
+            _finish_plot()
+            logger.info("Plot rendered for first raw/original spectrum.")
         else:
             logger.warning("Failed to load first raw/original spectrum.")
     else:
         logger.warning("No raw/original spectra found for plotting.")
-    input("Press Enter to continue...")
 
 
+@pytest.mark.hardware
 def test_take_spectrum_all_types():
     """Test all spectrum acquisition types."""
     logger.info("Testing all spectrum acquisition types...")
@@ -445,10 +612,13 @@ def test_conversion_duplicate_protection():
         # Second run (should not add duplicates)
         conversion_file = get_spectra_path() / "conversion_values.txt"
         if conversion_file.exists():
-            before = open(conversion_file).read()
+            before_size = conversion_file.stat().st_size
+            before = _file_digest(conversion_file)
             calculate_conversion_at_520nm()
-            after = open(conversion_file).read()
-            assert before == after, "Duplicate entries were added to conversion_values.txt"
+            # Size first, digest only when sizes match; the full bytes are read only to report a failure
+            if conversion_file.stat().st_size != before_size or _file_digest(conversion_file) != before:
+                tail = conversion_file.read_bytes()[before_size:].decode(errors="replace")
+                raise AssertionError(f"Duplicate entries were added to conversion_values.txt:\n{tail}")
             logger.info("Duplicate protection works as expected.")
         else:
             logger.warning("No conversion file found for duplicate protection test.")
@@ -462,14 +632,10 @@ def test_conversion_file_sorted():
     try:
         file_path = get_spectra_path() / "conversion_values.txt"
         if file_path.exists():
-            with open(file_path) as f:
-                lines = f.readlines()[1:]  # skip header
-            timestamps = []
-            for line in lines:
-                if line.strip():
-                    filename = line.split('\t')[0]  # Get filename from first column
-                    timestamp = extract_timestamp(filename)
-                    timestamps.append(timestamp)
+            lines = file_path.read_text().splitlines()[1:]  # skip header
+            # The filename is the first column, so the first timestamp match on a line is its own
+            timestamps = [m.group(1) if m else "unknown"
+                          for m in (_TIMESTAMP_SEARCH_RE.search(line) for line in lines if line.strip())]
             assert timestamps == sorted(timestamps), "conversion_values.txt is not sorted by timestamp"
             logger.info("conversion_values.txt is sorted by timestamp.")
         else:
@@ -478,6 +644,97 @@ def test_conversion_file_sorted():
         logger.warning(f"Sorting test failed: {e}")
 
 
+def test_process_new_spectrum():
+    """Test that the single-spectrum fast path matches the full pipeline."""
+    logger.info("Testing single-spectrum processing against the full pipeline...")
+    rng = np.random.default_rng(0)
+    wavelengths = np.linspace(200, 1000, 200)
+    reference = 1000 + rng.normal(0, 5, wavelengths.size)
+    new_name = "2025-01-01_00-03-00_UV_VIS_spectrum.txt"
+    new_intensities = reference * 0.7 - 2
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        fast_path = Path(temp_dir) / "fast"
+        fast_path.mkdir()
+        for name, intensities in [("2025-01-01_00-00-00_UV_VIS_reference_spectrum.txt", reference),
+                                  ("2025-01-01_00-01-00_UV_VIS_t0_spectrum.txt", reference * 0.5),
+                                  ("2025-01-01_00-02-00_UV_VIS_spectrum.txt", reference * 0.6)]:
+            save_spectrum_file(fast_path / name, wavelengths, intensities, HEADER_INTENSITY, FMT_SPECTRUM)
+        
+        # Nothing processed yet: the caller has to run the full pipeline
+        assert process_new_spectrum(fast_path / "2025-01-01_00-02-00_UV_VIS_spectrum.txt") is None
+        remove_negatives_from_spectra(str(fast_path))
+        calculate_absorbance(str(fast_path))
+        calculate_conversion_at_520nm(str(fast_path))
+        
+        # Other text files in the folder are not spectra and must not block the fast path
+        (fast_path / "notes.txt").write_text("Sample notes\nstirred overnight\n")
+        
+        batch_path = Path(temp_dir) / "batch"
+        shutil.copytree(fast_path, batch_path)
+        save_spectrum_file(fast_path / new_name, wavelengths, new_intensities, HEADER_INTENSITY, FMT_SPECTRUM)
+        save_spectrum_file(batch_path / new_name, wavelengths, new_intensities, HEADER_INTENSITY, FMT_SPECTRUM)
+        
+        conversion = process_new_spectrum(fast_path / new_name)
+        remove_negatives_from_spectra(str(batch_path))
+        calculate_absorbance(str(batch_path))
+        results = calculate_conversion_at_520nm(str(batch_path))
+        
+        assert conversion == results['conversions'][-1]
+        fast_files = sorted(p.name for p in fast_path.glob("*.txt"))
+        assert fast_files == sorted(p.name for p in batch_path.glob("*.txt"))
+        for name in fast_files:
+            assert (fast_path / name).read_bytes() == (batch_path / name).read_bytes(), name
+        
+        # A spectrum taken without calculate_conversion forces the next one onto the full pipeline
+        skipped_name = "2025-01-01_00-04-00_UV_VIS_spectrum.txt"
+        later_name = "2025-01-01_00-05-00_UV_VIS_spectrum.txt"
+        save_spectrum_file(fast_path / skipped_name, wavelengths, new_intensities, HEADER_INTENSITY, FMT_SPECTRUM)
+        save_spectrum_file(fast_path / later_name, wavelengths, new_intensities, HEADER_INTENSITY, FMT_SPECTRUM)
+        assert process_new_spectrum(fast_path / later_name) is None
+        assert not (fast_path / "2025-01-01_00-05-00_UV_VIS_spectrum_neg_removed.txt").exists()
+        remove_negatives_from_spectra(str(fast_path))
+        calculate_absorbance(str(fast_path))
+        calculate_conversion_at_520nm(str(fast_path))
+        log_text = (fast_path / "conversion_values.txt").read_text()
+        assert "2025-01-01_00-04-00_UV_VIS_spectrum_neg_removed_absorbance.txt" in log_text
+        assert "2025-01-01_00-05-00_UV_VIS_spectrum_neg_removed_absorbance.txt" in log_text
+    
+    logger.info("Single-spectrum processing matches the full pipeline.")
+
+
+def test_process_new_spectrum_missing_conversion_row():
+    """Test that a spectrum with absorbance but no conversion row forces the full pipeline."""
+    rng = np.random.default_rng(3)
+    wavelengths = np.linspace(200, 1000, 200)
+    reference = 1000 + rng.normal(0, 5, wavelengths.size)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        for name, intensities in [("2025-01-01_00-00-00_UV_VIS_reference_spectrum.txt", reference),
+                                  ("2025-01-01_00-01-00_UV_VIS_t0_spectrum.txt", reference * 0.5)]:
+            save_spectrum_file(temp_path / name, wavelengths, intensities, HEADER_INTENSITY, FMT_SPECTRUM)
+        remove_negatives_from_spectra(str(temp_path))
+        calculate_absorbance(str(temp_path))
+        calculate_conversion_at_520nm(str(temp_path))
+        
+        # Pipeline stopped before the conversion step for 00-02-00
+        save_spectrum_file(temp_path / "2025-01-01_00-02-00_UV_VIS_spectrum.txt", wavelengths, reference * 0.6,
+                           HEADER_INTENSITY, FMT_SPECTRUM)
+        remove_negatives_from_spectra(str(temp_path))
+        calculate_absorbance(str(temp_path))
+        
+        new_file = temp_path / "2025-01-01_00-03-00_UV_VIS_spectrum.txt"
+        save_spectrum_file(new_file, wavelengths, reference * 0.7, HEADER_INTENSITY, FMT_SPECTRUM)
+        assert process_new_spectrum(new_file) is None
+        
+        remove_negatives_from_spectra(str(temp_path))
+        calculate_absorbance(str(temp_path))
+        results = calculate_conversion_at_520nm(str(temp_path))
+        assert "2025-01-01_00-02-00_UV_VIS_spectrum_neg_removed_absorbance.txt" in results['filenames']
+        assert "2025-01-01_00-03-00_UV_VIS_spectrum_neg_removed_absorbance.txt" in results['filenames']
+
+
 def test_error_handling():
     """Test error handling for various edge cases."""
     logger.info("Testing error handling...")
@@ -506,49 +763,9 @@ def debug_spectra_folder(data_folder=DATA_FOLDER):
         logger.info(f"All files: {list(path.glob('*'))}")
         txt_files = list(path.glob("*.txt"))
         logger.info(f"All .txt files: {txt_files}")
-        for pattern in [PATTERN_REFERENCE, PATTERN_T0, PATTERN_ABSORBANCE, PATTERN_NEG_REMOVED]:
-            files = np.array([str(f) for f in txt_files])
-            mask = np.char.find(files.astype(str), pattern) >= 0
-            logger.info(f"Files matching '{pattern}': {files[mask]}")
-
-
-if __name__ == "__main__":
-    # Run all tests
-    logger.info("Starting comprehensive UV-VIS utils test suite...")
-    
-    # Basic functionality tests
-    test_get_timestamp()
-    test_generate_filename()
-    test_get_spectra_path()
-    test_find_files_by_pattern()
-    test_find_files_by_patterns()
-    test_zero_negatives()
-    test_extract_timestamp()
-    test_find_wavelength_index()
-    test_validate_spectrum_data()
-    test_save_spectrum_file()
-    test_error_handling()
-    
-    # Data processing tests
-    test_remove_negatives()
-    test_calculate_absorbance()
-    test_calculate_conversion()
-    test_check_absorbance_stability()
-    
-    # File operation tests
-    test_conversion_duplicate_protection()
-    test_conversion_file_sorted()
-    
-    # Hardware-dependent tests (may fail if hardware not available)
-    test_take_spectrum()
-    test_take_spectrum_all_types()
-    
-    # Visualization tests
-    test_plot_first_raw()
-    test_plot_first_neg_removed()
-    test_plot_first_absorbance()
-    
-    # Uncomment the next line if you want to run diagnostics
-    # debug_spectra_folder()
-    
-    logger.info("All tests completed!")
\ No newline at end of file
+        # Plain str containment on the names is cheaper than a fixed-width numpy string array
+        names = [f.name for f in txt_files]
+        for pattern in _DEBUG_PATTERNS:
+            matches = [name for name in names if pattern in name]
+            logger.info(f"Files matching '{pattern}': {matches}")
+